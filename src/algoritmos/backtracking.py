@@ -32,4 +32,30 @@ def process_solution(vetor, n, valores):
     
     for i in range(n):
         valor_total += valores[i] if vetor[i] else 0
-    return valor_total
\ No newline at end of file
+    return valor_total
+
+# Versão instrumentada (ver algoritmos/instrumentacao.py). Mantém a mesma
+# lógica de backtrack; alterações em uma devem ser replicadas na outra
+# (verificacao.py confere que as duas dão a mesma resposta).
+instrumentacao = None
+
+def backtrack_instrumentado(vetor, k, n, capacidade_peso, capacidade_volume, pesos, volumes, valores, peso_atual, volume_atual):
+    global melhor_valor, melhor_solucao
+    
+    instrumentacao.no(k)
+    
+    if k == n:
+        valor = process_solution(vetor, n, valores)
+        if valor > melhor_valor:
+            melhor_valor = valor
+            melhor_solucao = vetor.copy()
+            instrumentacao.incumbente(k, valor)
+    else:
+        c = construct_candidates(k, peso_atual, volume_atual, pesos, volumes, capacidade_peso, capacidade_volume)
+        if len(c) == 1:
+            instrumentacao.poda('inviavel', k)
+        for possibilidade in c:
+            vetor[k] = possibilidade
+            novo_peso = peso_atual + (pesos[k] if possibilidade else 0)
+            novo_volume = volume_atual + (volumes[k] if possibilidade else 0)
+            backtrack_instrumentado(vetor, k + 1, n, capacidade_peso, capacidade_volume, pesos, volumes, valores, novo_peso, novo_volume)
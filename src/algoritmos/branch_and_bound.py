@@ -2,6 +2,8 @@
 Branch and Bound para Mochila 0-1 com duas restrições (peso e volume)
 """
 
+import time
+
 melhor_valor = 0
 melhor_solucao = []
 
@@ -66,4 +68,44 @@ def construct_candidates(k, peso_atual, volume_atual, pesos, volumes, capacidade
     # Depois tentar não incluir
     c.append(False)
         
-    return c
\ No newline at end of file
+    return c
+
+# Versão instrumentada (ver algoritmos/instrumentacao.py). Mantém a mesma
+# lógica de backtrack; alterações em uma devem ser replicadas na outra
+# (verificacao.py confere que as duas dão a mesma resposta).
+instrumentacao = None
+
+def backtrack_instrumentado(vetor, k, n, capacidade_peso, capacidade_volume, pesos, volumes, valores, peso_atual, volume_atual, valor_atual):
+    global melhor_valor, melhor_solucao
+    
+    instrumentacao.no(k)
+    
+    # Caso base: chegou ao fim
+    if k == n:
+        if valor_atual > melhor_valor:
+            melhor_valor = valor_atual
+            melhor_solucao = vetor.copy()
+            instrumentacao.incumbente(k, valor_atual)
+        return
+    
+    # Calcular limitante superior para o nó atual (cronometrado)
+    inicio = time.perf_counter()
+    limitante = calcular_limitante_superior(k, n, capacidade_peso, capacidade_volume, 
+                                            pesos, volumes, valores, peso_atual, volume_atual, valor_atual)
+    instrumentacao.limitante(time.perf_counter() - inicio)
+    
+    # PODA: Se o limitante não supera o melhor valor, não explore este ramo
+    if limitante <= melhor_valor:
+        instrumentacao.poda('limitante', k)
+        return
+    
+    # Explorar ramos
+    c = construct_candidates(k, peso_atual, volume_atual, pesos, volumes, capacidade_peso, capacidade_volume)
+    if len(c) == 1:
+        instrumentacao.poda('inviavel', k)
+    for possibilidade in c:
+        vetor[k] = possibilidade
+        novo_peso = peso_atual + (pesos[k] if possibilidade else 0)
+        novo_volume = volume_atual + (volumes[k] if possibilidade else 0)
+        novo_valor = valor_atual + (valores[k] if possibilidade else 0)
+        backtrack_instrumentado(vetor, k + 1, n, capacidade_peso, capacidade_volume, pesos, volumes, valores, novo_peso, novo_volume, novo_valor)
@@ -0,0 +1,89 @@
+# algoritmos/dinamico_memmap.py
+"""
+Programação dinâmica fora da memória para capacidades grandes.
+
+Em vez do cubo (W+1 x V+1 x n+1) de inteiros Python de dinamico(), mantém em
+RAM só a camada atual (W+1 x V+1) com o menor dtype inteiro que comporta a
+soma dos valores, e grava em disco (np.memmap) apenas um bit de decisão por
+(item, w, v). A camada é atualizada em blocos de linhas de w do tamanho da
+cache, e a solução é reconstruída lendo o memmap de trás para frente.
+"""
+
+import os
+import tempfile
+import numpy as np
+
+# Tamanho aproximado de cada bloco da camada (cache L2)
+BYTES_BLOCO = 256 * 1024
+
+def escolher_dtype(soma_valores):
+    """Menor dtype inteiro sem sinal capaz de guardar `soma_valores`."""
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if soma_valores <= np.iinfo(dtype).max:
+            return dtype
+    raise OverflowError(f"Soma dos valores ({soma_valores}) não cabe em 64 bits")
+
+def dinamico_memmap(W, V, n, pesos, volumes, valores, diretorio=None):
+    """
+    Mesma interface de dinamico() (listas indexadas a partir de 1).
+    `diretorio` é onde fica o arquivo temporário de decisões (padrão: TMPDIR).
+    """
+    dtype = escolher_dtype(sum(valores[1:n + 1]))
+    K = np.zeros((W + 1, V + 1), dtype=dtype)
+
+    # Bits de decisão: item j, linha w, V+1 colunas empacotadas em bytes
+    bytes_por_linha = (V + 1 + 7) // 8
+    fd, caminho = tempfile.mkstemp(suffix='.dp', dir=diretorio)
+    os.close(fd)
+    decisoes = None
+
+    try:
+        if n > 0:
+            decisoes = np.memmap(caminho, dtype=np.uint8, mode='w+',
+                                 shape=(n, W + 1, bytes_por_linha))
+
+        linhas_por_bloco = max(1, BYTES_BLOCO // ((V + 1) * K.itemsize))
+
+        for j in range(1, n + 1):
+            p, l, val = pesos[j], volumes[j], valores[j]
+            bits = decisoes[j - 1]
+
+            # Item que não cabe: linha de decisões fica zerada (arquivo novo)
+            if p > W or l > V:
+                continue
+
+            # Blocos de w em ordem decrescente: as linhas w - p lidas por um
+            # bloco ainda não foram sobrescritas nesta iteração.
+            topo = W + 1
+            while topo > 0:
+                base = max(0, topo - linhas_por_bloco)
+                inicio = max(base, p)
+                escolha = np.zeros((topo - base, V + 1), dtype=bool)
+
+                if inicio < topo:
+                    atual = K[inicio:topo, l:]
+                    candidato = K[inicio - p:topo - p, :V + 1 - l] + dtype(val)
+                    melhora = candidato > atual
+                    np.maximum(atual, candidato, out=atual)
+                    escolha[inicio - base:, l:] = melhora
+
+                bits[base:topo] = np.packbits(escolha, axis=1)
+                topo = base
+
+        melhor_valor = int(K[W, V])
+
+        # Recuperação da solução lendo as decisões do último item ao primeiro
+        melhor_solucao = [False] * n
+        w_at, v_at = W, V
+
+        for j in range(n, 0, -1):
+            byte = int(decisoes[j - 1, w_at, v_at // 8])
+            if (byte >> (7 - v_at % 8)) & 1:
+                melhor_solucao[j - 1] = True
+                w_at -= pesos[j]
+                v_at -= volumes[j]
+    finally:
+        del decisoes
+        os.remove(caminho)
+
+    return melhor_valor, melhor_solucao
@@ -0,0 +1,155 @@
+"""
+Reotimização incremental: sessão que guarda o estado entre resoluções.
+
+Quando o conjunto de itens muda pouco (itens adicionados, removidos ou com
+valor alterado, ou capacidade alterada) a sessão recalcula só o necessário:
+
+- motor 'dinamico': guarda todas as camadas K_j (W_max+1 x V_max+1) da PD.
+  Uma alteração no item i invalida apenas as camadas j >= i, então adicionar
+  um item custa uma camada e remover/alterar o item i custa n - i camadas.
+  Mudar a capacidade dentro da faixa já calculada não recalcula nada; fora
+  dela, a faixa aumenta e tudo é recalculado.
+- motor 'branch_and_bound': guarda a solução ótima anterior. Na próxima
+  resolução ela é ajustada para ficar viável (tirando os itens de menor valor
+  se preciso) e usada como incumbente inicial, o que poda desde a raiz.
+"""
+
+import time
+import algoritmos.branch_and_bound as bnb
+
+MOTORES = ('dinamico', 'branch_and_bound')
+
+class SessaoMochila:
+    def __init__(self, W, V, itens, motor='dinamico', W_max=None, V_max=None):
+        if motor not in MOTORES:
+            raise ValueError(f"Motor desconhecido: {motor} (use {', '.join(MOTORES)})")
+
+        self.motor = motor
+        self.W, self.V = W, V
+        self.W_max = max(W, W_max or 0)
+        self.V_max = max(V, V_max or 0)
+        self.itens = list(itens)
+
+        # PD: camadas[j] = K considerando os j primeiros itens; válidas até camadas_validas
+        self.camadas = [self._camada_vazia()]
+        self.camadas_validas = 0
+
+        # B&B: última solução (alinhada com self.itens) para o warm start
+        self.solucao_anterior = [False] * len(self.itens)
+
+    # ---- Alterações -------------------------------------------------------
+
+    def adicionar_item(self, item):
+        """Adiciona um item (peso, volume, valor) ao final. Retorna seu índice."""
+        self.itens.append(tuple(item))
+        self.solucao_anterior.append(False)
+        return len(self.itens) - 1
+
+    def remover_item(self, indice):
+        """Remove o item `indice` (os seguintes passam a ter índice - 1)."""
+        indice = self._normalizar(indice)
+        del self.itens[indice]
+        del self.solucao_anterior[indice]
+        self._invalidar(indice)
+
+    def alterar_item(self, indice, item):
+        """Troca peso, volume e/ou valor do item `indice`."""
+        indice = self._normalizar(indice)
+        self.itens[indice] = tuple(item)
+        self._invalidar(indice)
+
+    def alterar_capacidade(self, W, V):
+        """Altera (W, V). Dentro de (W_max, V_max) a PD não recalcula camadas."""
+        self.W, self.V = W, V
+        if W > self.W_max or V > self.V_max:
+            self.W_max = max(W, self.W_max)
+            self.V_max = max(V, self.V_max)
+            self.camadas = [self._camada_vazia()]
+            self.camadas_validas = 0
+
+    # ---- Resolução --------------------------------------------------------
+
+    def resolver(self):
+        """
+        Resolve com o estado atual aproveitando o que foi calculado antes.
+        Retorna: (melhor_valor, melhor_solucao, tempo_execucao)
+        """
+        inicio = time.time()
+        if self.motor == 'dinamico':
+            melhor_valor, melhor_solucao = self._resolver_dinamico()
+        else:
+            melhor_valor, melhor_solucao = self._resolver_branch_and_bound()
+        tempo = time.time() - inicio
+
+        self.solucao_anterior = list(melhor_solucao)
+        return melhor_valor, melhor_solucao, tempo
+
+    def _normalizar(self, indice):
+        """Índice em [0, n), aceitando negativos como nas listas."""
+        n = len(self.itens)
+        if not -n <= indice < n:
+            raise IndexError(f"Item {indice} não existe (a sessão tem {n} itens)")
+        return indice % n
+
+    def _invalidar(self, indice):
+        self.camadas_validas = min(self.camadas_validas, indice)
+
+    def _camada_vazia(self):
+        return [[0] * (self.V_max + 1) for _ in range(self.W_max + 1)]
+
+    def _resolver_dinamico(self):
+        n = len(self.itens)
+        del self.camadas[self.camadas_validas + 1:]
+
+        # Camadas que faltam (itens novos ou posteriores a uma alteração)
+        for j in range(self.camadas_validas, n):
+            peso, volume, valor = self.itens[j]
+            anterior = self.camadas[j]
+            camada = [linha[:] for linha in anterior]
+
+            if peso <= self.W_max and volume <= self.V_max:
+                for w in range(peso, self.W_max + 1):
+                    linha = camada[w]
+                    linha_origem = anterior[w - peso]
+                    for v in range(volume, self.V_max + 1):
+                        candidato = linha_origem[v - volume] + valor
+                        if candidato > linha[v]:
+                            linha[v] = candidato
+
+            self.camadas.append(camada)
+        self.camadas_validas = n
+
+        # Recuperação da solução a partir da capacidade atual
+        melhor_solucao = [False] * n
+        w_at, v_at = self.W, self.V
+        for j in range(n, 0, -1):
+            if self.camadas[j][w_at][v_at] != self.camadas[j - 1][w_at][v_at]:
+                melhor_solucao[j - 1] = True
+                w_at -= self.itens[j - 1][0]
+                v_at -= self.itens[j - 1][1]
+
+        return self.camadas[n][self.W][self.V], melhor_solucao
+
+    def _resolver_branch_and_bound(self):
+        n = len(self.itens)
+        pesos = [item[0] for item in self.itens]
+        volumes = [item[1] for item in self.itens]
+        valores = [item[2] for item in self.itens]
+
+        # Warm start: solução anterior, tirando itens de menor valor até ficar viável
+        incumbente = list(self.solucao_anterior)
+        escolhidos = sorted((i for i in range(n) if incumbente[i]), key=lambda i: valores[i])
+        peso_total = sum(pesos[i] for i in escolhidos)
+        volume_total = sum(volumes[i] for i in escolhidos)
+        for i in escolhidos:
+            if peso_total <= self.W and volume_total <= self.V:
+                break
+            incumbente[i] = False
+            peso_total -= pesos[i]
+            volume_total -= volumes[i]
+
+        bnb.melhor_valor = sum(valores[i] for i in range(n) if incumbente[i])
+        bnb.melhor_solucao = incumbente
+        bnb.backtrack([False] * n, 0, n, self.W, self.V, pesos, volumes, valores, 0, 0, 0)
+
+        return bnb.melhor_valor, bnb.melhor_solucao
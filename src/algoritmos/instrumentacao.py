@@ -0,0 +1,102 @@
+"""
+Instrumentação opcional das buscas em árvore (backtracking e branch and bound).
+
+As versões instrumentadas `backtrack_instrumentado` de cada módulo recebem um
+objeto Instrumentacao pela variável global `instrumentacao` do módulo; as
+funções `backtrack` originais não são tocadas, então desligada a instrumentação
+não custa nada.
+"""
+
+import json
+import time
+
+class Instrumentacao:
+    """
+    Contadores de uma execução:
+    - nós visitados por profundidade;
+    - podas por motivo ('inviavel': item não cabe, 'limitante': bound <= incumbente);
+    - número e tempo total das avaliações do limitante;
+    - incumbentes encontrados (tempo, valor, nós até ali): o primeiro e o melhor.
+
+    Com amostragem > 0 também guarda um trace compacto com 1 de cada
+    `amostragem` eventos de nó/poda (incumbentes sempre entram), até
+    `limite_trace` eventos.
+    """
+
+    def __init__(self, n, amostragem=0, limite_trace=100000):
+        self.nos_por_profundidade = [0] * (n + 1)
+        self.podas = {'inviavel': 0, 'limitante': 0}
+        self.avaliacoes_limitante = 0
+        self.tempo_limitante = 0.0
+        self.incumbentes = []
+        self.trace = []
+        self.amostragem = amostragem
+        self.limite_trace = limite_trace
+        self.eventos = 0
+        self.inicio = time.perf_counter()
+        self.tempo_total = None
+
+    def _registrar(self, evento, k, valor=None, sempre=False):
+        self.eventos += 1
+        if not self.amostragem or len(self.trace) >= self.limite_trace:
+            return
+        if sempre or self.eventos % self.amostragem == 0:
+            self.trace.append((round(time.perf_counter() - self.inicio, 7), evento, k, valor))
+
+    def no(self, k):
+        self.nos_por_profundidade[k] += 1
+        self._registrar('no', k)
+
+    def poda(self, motivo, k):
+        self.podas[motivo] += 1
+        self._registrar('poda_' + motivo, k)
+
+    def limitante(self, duracao):
+        self.avaliacoes_limitante += 1
+        self.tempo_limitante += duracao
+
+    def incumbente(self, k, valor):
+        self.incumbentes.append((time.perf_counter() - self.inicio, valor, self.total_nos()))
+        self._registrar('incumbente', k, valor, sempre=True)
+
+    def finalizar(self):
+        self.tempo_total = time.perf_counter() - self.inicio
+
+    def total_nos(self):
+        return sum(self.nos_por_profundidade)
+
+    def resumo(self):
+        """Dicionário serializável com os contadores (sem o trace)."""
+        primeiro = self.incumbentes[0] if self.incumbentes else None
+        melhor = self.incumbentes[-1] if self.incumbentes else None
+        return {
+            'tempo_total': self.tempo_total,
+            'total_nos': self.total_nos(),
+            'nos_por_profundidade': self.nos_por_profundidade,
+            'podas': dict(self.podas),
+            'avaliacoes_limitante': self.avaliacoes_limitante,
+            'tempo_limitante': self.tempo_limitante,
+            'tempo_primeiro_incumbente': primeiro[0] if primeiro else None,
+            'tempo_melhor_incumbente': melhor[0] if melhor else None,
+            'incumbentes': [list(i) for i in self.incumbentes],
+        }
+
+    def salvar(self, caminho, **extras):
+        """Salva resumo + trace em JSON (lido por analise_resultados.plotar_perfil_busca)."""
+        perfil = dict(extras, **self.resumo())
+        perfil['trace'] = [list(e) for e in self.trace]
+        with open(caminho, 'w') as f:
+            json.dump(perfil, f)
+
+    def imprimir(self):
+        r = self.resumo()
+        print(f"Nós visitados: {r['total_nos']}")
+        print(f"Podas por inviabilidade: {r['podas']['inviavel']}")
+        print(f"Podas por limitante: {r['podas']['limitante']}")
+        if r['avaliacoes_limitante']:
+            print(f"Avaliações do limitante: {r['avaliacoes_limitante']} "
+                  f"({r['tempo_limitante']:.7f}s no total)")
+        if r['incumbentes']:
+            print(f"Primeiro incumbente: {r['tempo_primeiro_incumbente']:.7f}s")
+            print(f"Melhor incumbente: {r['tempo_melhor_incumbente']:.7f}s "
+                  f"(após {r['incumbentes'][-1][2]} nós)")
@@ -12,13 +12,14 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 from pathlib import Path
+from utils import DIRETORIO_RESULTADOS, DIRETORIO_GRAFICOS
 
 # Configuração de estilo
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 plt.rcParams['font.size'] = 10
 
-def carregar_todos_resultados(pasta_resultados='resultados'):
+def carregar_todos_resultados(pasta_resultados=DIRETORIO_RESULTADOS):
     """Carrega todos os CSVs de resultados em um único DataFrame."""
     todos_dfs = []
     
@@ -263,38 +264,40 @@ def plotar_complexidade_empirica(df, salvar=True):
             break
         
         dados = df[df['Algoritmo'] == algoritmo].sort_values('N_Itens')
+        t = dados['Tempo_Medio'].values
         
-        # Plot tempo vs n
-        axes[idx].scatter(dados['N_Itens'], dados['Tempo_Medio'], 
-                         alpha=0.6, s=50, label='Dados')
+        # O dinâmico é O(n·W·V): com várias capacidades misturadas, o eixo certo é n·W·V
+        if algoritmo == 'Dinamico':
+            x = (dados['N_Itens'] * dados['Capacidade_W'] * dados['Capacidade_V']).values
+            axes[idx].set_xlabel('n · W · V')
+        else:
+            x = dados['N_Itens'].values
+            axes[idx].set_xlabel('Número de Itens (n)')
         
-        # Ajustar curvas
-        n = dados['N_Itens'].values
-        t = dados['Tempo_Medio'].values
+        axes[idx].scatter(x, t, alpha=0.6, s=50, label='Dados')
         
-        if len(n) > 3:
+        # Ajustar curvas (a suíte escalabilidade.py faz o ajuste com IC em varreduras controladas)
+        if len(x) > 3:
             # Tentar ajuste exponencial para Backtracking/B&B
             if algoritmo in ['Backtracking', 'Branch_and_Bound']:
                 try:
                     from scipy.optimize import curve_fit
                     def exp_func(x, a, b):
                         return a * np.exp(b * x)
-                    params, _ = curve_fit(exp_func, n, t, maxfev=10000)
-                    n_fit = np.linspace(n.min(), n.max(), 100)
-                    axes[idx].plot(n_fit, exp_func(n_fit, *params), 
-                                 'r--', label=f'Ajuste: ae^(bn)', linewidth=2)
-                except:
-                    pass
+                    params, _ = curve_fit(exp_func, x, t, maxfev=10000)
+                    x_fit = np.linspace(x.min(), x.max(), 100)
+                    axes[idx].plot(x_fit, exp_func(x_fit, *params), 
+                                 'r--', label=f'Ajuste: ae^(bn), b={params[1]:.3f}', linewidth=2)
+                except (ImportError, RuntimeError, ValueError) as erro:
+                    print(f"⚠️  Ajuste exponencial falhou para {algoritmo}: {erro}")
             
-            # Ajuste polinomial para Dinâmico
+            # Ajuste linear em n·W·V (pela origem) para Dinâmico
             else:
-                poly = np.polyfit(n, t, 2)
-                p = np.poly1d(poly)
-                n_fit = np.linspace(n.min(), n.max(), 100)
-                axes[idx].plot(n_fit, p(n_fit), 
-                             'g--', label=f'Ajuste: O(n²)', linewidth=2)
+                c = np.dot(x, t) / np.dot(x, x)
+                x_fit = np.linspace(0, x.max(), 100)
+                axes[idx].plot(x_fit, c * x_fit, 
+                             'g--', label=f'Ajuste: O(n·W·V), c={c:.2e}s', linewidth=2)
         
-        axes[idx].set_xlabel('Número de Itens (n)')
         axes[idx].set_ylabel('Tempo (s)')
         axes[idx].set_title(f'Complexidade Empírica - {algoritmo}')
         axes[idx].legend()
@@ -306,14 +309,125 @@ def plotar_complexidade_empirica(df, salvar=True):
         print("📊 Gráfico salvo: analise_complexidade.png")
     plt.close()
 
-def main():
+def carregar_perfis(pasta_perfis):
+    """
+    Carrega os perfis de busca (JSON de Instrumentacao.salvar) de uma pasta
+    em um DataFrame com uma linha por execução instrumentada.
+    """
+    import json
+    
+    linhas = []
+    for arquivo in sorted(Path(pasta_perfis).glob('*.json')):
+        with open(arquivo) as f:
+            perfil = json.load(f)
+        linhas.append({
+            'Arquivo': arquivo.name,
+            'Instancia': perfil.get('instancia'),
+            'Algoritmo': perfil.get('algoritmo'),
+            'Tempo_Total': perfil['tempo_total'],
+            'Total_Nos': perfil['total_nos'],
+            'Profundidade_Max': len(perfil['nos_por_profundidade']) - 1,
+            'Podas_Inviavel': perfil['podas']['inviavel'],
+            'Podas_Limitante': perfil['podas']['limitante'],
+            'Tempo_Limitante': perfil['tempo_limitante'],
+            'Tempo_Primeiro_Incumbente': perfil['tempo_primeiro_incumbente'],
+            'Tempo_Melhor_Incumbente': perfil['tempo_melhor_incumbente'],
+        })
+    
+    if not linhas:
+        print(f"❌ Nenhum perfil encontrado em {pasta_perfis}/")
+        return None
+    return pd.DataFrame(linhas)
+
+def gerar_tabela_perfis(df, pasta_graficos='.'):
+    """
+    Tabela dos perfis por instância e algoritmo (nós, podas, tempo no
+    limitante e até os incumbentes), impressa e salva em tabela_perfis.csv.
+    """
+    tabela = df.sort_values(['Instancia', 'Algoritmo']).drop(columns=['Arquivo'])
+    tabela['Fracao_Tempo_Limitante'] = tabela['Tempo_Limitante'] / tabela['Tempo_Total']
+    
+    print("\n" + "="*80)
+    print("PERFIS DE BUSCA POR INSTÂNCIA")
+    print("="*80)
+    print(tabela.to_string(index=False))
+    
+    caminho = os.path.join(pasta_graficos, 'tabela_perfis.csv')
+    tabela.to_csv(caminho, index=False)
+    print(f"\n📊 Tabela salva: {caminho}")
+    return tabela
+
+def plotar_perfil_busca(caminho_perfil, salvar=True, pasta_graficos='.'):
+    """
+    Perfil de uma execução instrumentada: nós, podas, incumbentes e trace.
+    O gráfico é salvo em `pasta_graficos` (padrão: diretório atual).
+    """
+    import json
+    
+    with open(caminho_perfil) as f:
+        perfil = json.load(f)
+    
+    nome = Path(caminho_perfil).stem
+    fig, axes = plt.subplots(2, 2, figsize=(16, 10))
+    
+    # Nós visitados por profundidade
+    nos = perfil['nos_por_profundidade']
+    axes[0, 0].bar(range(len(nos)), nos, color='steelblue', alpha=0.8)
+    axes[0, 0].set_yscale('log')
+    axes[0, 0].set_xlabel('Profundidade (k)')
+    axes[0, 0].set_ylabel('Nós visitados (log)')
+    axes[0, 0].set_title(f'Nós por Profundidade - total {perfil["total_nos"]}')
+    axes[0, 0].grid(True, alpha=0.3, axis='y')
+    
+    # Podas por motivo
+    motivos = list(perfil['podas'].keys())
+    axes[0, 1].bar(motivos, [perfil['podas'][m] for m in motivos], color=['orange', 'green'], alpha=0.8)
+    axes[0, 1].set_ylabel('Quantidade')
+    axes[0, 1].set_title(f'Podas por Motivo - limitante: {perfil["avaliacoes_limitante"]} '
+                         f'avaliações, {perfil["tempo_limitante"]:.4f}s')
+    axes[0, 1].grid(True, alpha=0.3, axis='y')
+    
+    # Evolução do incumbente
+    if perfil['incumbentes']:
+        tempos = [i[0] for i in perfil['incumbentes']] + [perfil['tempo_total']]
+        valores = [i[1] for i in perfil['incumbentes']] + [perfil['incumbentes'][-1][1]]
+        axes[1, 0].step(tempos, valores, where='post', marker='o', linewidth=2)
+    axes[1, 0].set_xlabel('Tempo (s)')
+    axes[1, 0].set_ylabel('Valor do incumbente')
+    axes[1, 0].set_title('Evolução do Melhor Valor')
+    axes[1, 0].grid(True, alpha=0.3)
+    
+    # Trace (amostrado): profundidade ao longo do tempo por tipo de evento
+    trace = pd.DataFrame(perfil.get('trace', []), columns=['Tempo', 'Evento', 'Profundidade', 'Valor'])
+    if trace.empty:
+        axes[1, 1].text(0.5, 0.5, 'Sem trace (rode com amostragem > 0)', ha='center', va='center')
+        axes[1, 1].axis('off')
+    else:
+        for evento in trace['Evento'].unique():
+            dados = trace[trace['Evento'] == evento]
+            axes[1, 1].scatter(dados['Tempo'], dados['Profundidade'], s=8, alpha=0.6, label=evento)
+        axes[1, 1].set_xlabel('Tempo (s)')
+        axes[1, 1].set_ylabel('Profundidade (k)')
+        axes[1, 1].set_title('Trace da Busca')
+        axes[1, 1].legend(fontsize=8)
+        axes[1, 1].grid(True, alpha=0.3)
+    
+    plt.suptitle(f'Perfil de Busca - {perfil.get("algoritmo", "")} - {nome}')
+    plt.tight_layout()
+    if salvar:
+        caminho_grafico = os.path.join(pasta_graficos, f'perfil_{nome}.png')
+        plt.savefig(caminho_grafico, dpi=300, bbox_inches='tight')
+        print(f"📊 Gráfico salvo: {caminho_grafico}")
+    plt.close()
+
+def main(pasta_resultados=DIRETORIO_RESULTADOS, pasta_graficos=DIRETORIO_GRAFICOS):
     """Função principal."""
     print("="*80)
     print("ANÁLISE DE RESULTADOS - PROBLEMA DA MOCHILA BIDIMENSIONAL")
     print("="*80)
     
     # Carregar dados
-    df = carregar_todos_resultados()
+    df = carregar_todos_resultados(pasta_resultados)
     if df is None:
         return
     
@@ -322,8 +436,8 @@ def main():
     print(f"Capacidades testadas: {len(df.groupby(['Capacidade_W', 'Capacidade_V']))}")
     
     # Criar pasta para gráficos
-    os.makedirs('graficos', exist_ok=True)
-    os.chdir('graficos')
+    os.makedirs(pasta_graficos, exist_ok=True)
+    os.chdir(pasta_graficos)
     
     # Gerar análises
     print("\n" + "="*80)
@@ -1,16 +1,15 @@
 import os
 import csv
 import statistics
-from utils import ler_instancia
+from utils import ler_instancia, DIRETORIO_INSTANCIAS, DIRETORIO_RESULTADOS
 from experimentos import (
     resolver_backtracking,
     resolver_branch_and_bound,
     resolver_dinamico
 )
 
-def rodar_benchmark(pastas_escolhidas):
-    diretorio_base = "../instancias/"
-    diretorio_resultados = "resultados"
+def rodar_benchmark(pastas_escolhidas, diretorio_base=DIRETORIO_INSTANCIAS,
+                    diretorio_resultados=DIRETORIO_RESULTADOS):
 
     # Cria a pasta resultados se não existir
     os.makedirs(diretorio_resultados, exist_ok=True)
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Suíte de escalabilidade assintótica dos algoritmos.
+
+Varre n, W e V de forma independente em grades geométricas (as outras duas
+dimensões ficam fixas), com parada antecipada na primeira célula em que uma
+resolução passa do orçamento de tempo (cada resolução é interrompida ao
+atingir o orçamento, então o passo seguinte da grade não roda sem limite). Para cada varredura ajusta o modelo esperado:
+
+- Dinâmico: t ~ c * x^k em cada dimensão (O(n*W*V) => k ~ 1 em n, W e V);
+- Backtracking / B&B: t ~ c * b^n em n (b = fator de ramificação efetivo)
+  e t ~ c * x^k em W e V.
+
+Quando a parada antecipada deixa menos de MIN_PONTOS células úteis (comum em
+n para as buscas em árvore, que crescem exponencialmente), a grade é refinada
+com pontos intermediários, também interrompidos no orçamento.
+
+Os ajustes são regressões lineares em escala log com intervalo de confiança
+de 95%, em Python puro para rodar sem numpy/scipy. Com --verificar a suíte
+compara o resultado com uma baseline salva e retorna código 1 se algum
+algoritmo ficou mais lento ou cresceu mais rápido do que antes.
+
+Uso:
+    python3 escalabilidade.py --salvar-baseline
+    python3 escalabilidade.py --verificar
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+from gerador_instancias import gerar_itens
+from utils import executar_com_limite, TempoLimiteExcedido, DIRETORIO_RESULTADOS
+
+CAMINHO_BASELINE = os.path.join(DIRETORIO_RESULTADOS, "escalabilidade_baseline.json")
+
+# Modelo ajustado para cada (algoritmo, dimensão varrida)
+MODELOS = {
+    'Dinamico': {'n': 'potencia', 'W': 'potencia', 'V': 'potencia'},
+    'Backtracking': {'n': 'exponencial', 'W': 'potencia', 'V': 'potencia'},
+    'Branch_and_Bound': {'n': 'exponencial', 'W': 'potencia', 'V': 'potencia'},
+    'Dinamico_Memmap': {'n': 'potencia', 'W': 'potencia', 'V': 'potencia'},
+}
+
+# Valor teórico do parâmetro ajustado (None = sem expectativa fechada)
+ESPERADO = {
+    'Dinamico': {'n': 1.0, 'W': 1.0, 'V': 1.0},
+    'Backtracking': {'n': 2.0, 'W': None, 'V': None},
+    'Branch_and_Bound': {'n': 2.0, 'W': None, 'V': None},
+    'Dinamico_Memmap': {'n': 1.0, 'W': 1.0, 'V': 1.0},
+}
+
+# Rodados por padrão (Dinamico_Memmap depende de numpy, então é opcional)
+PADRAO = ['Backtracking', 'Branch_and_Bound', 'Dinamico']
+
+# Ponto fixo das dimensões que não estão sendo varridas
+PONTO_FIXO = {'n': 20, 'W': 50, 'V': 50}
+
+# Mínimo de células acima de tempo_minimo em cada varredura (refinando a grade)
+MIN_PONTOS = 6
+
+GRADES = {
+    'n': (8, 128),
+    'W': (10, 160),
+    'V': (10, 160),
+}
+
+# Quantis t de Student (bicaudal, 95%) por graus de liberdade
+T_975 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 30: 2.042,
+}
+
+def quantil_t(graus):
+    """Quantil t de 97,5% (usa o maior tabelado <= graus; 1.96 acima de 30)."""
+    if graus > 30:
+        return 1.96
+    return T_975[max(g for g in T_975 if g <= graus)]
+
+def grade_geometrica(inicio, fim, fator=math.sqrt(2)):
+    """Valores inteiros distintos de inicio a fim, crescendo por `fator`."""
+    grade = []
+    x = float(inicio)
+    while round(x) <= fim:
+        if not grade or round(x) != grade[-1]:
+            grade.append(round(x))
+        x *= fator
+    return grade
+
+def carregar_resolvedores(nomes):
+    import experimentos
+
+    funcoes = {
+        'Dinamico': experimentos.resolver_dinamico,
+        'Backtracking': experimentos.resolver_backtracking,
+        'Branch_and_Bound': experimentos.resolver_branch_and_bound,
+        'Dinamico_Memmap': experimentos.resolver_dinamico_memmap,
+    }
+    return {nome: funcoes[nome] for nome in nomes}
+
+def medir_celula(resolver, n, W, V, sementes, repeticoes, limite=None):
+    """
+    Tempo de `resolver` em uma instância aleatória por semente: o mínimo das
+    repetições (menos sensível a ruído do sistema) e a mediana entre sementes.
+    Com `limite`, cada resolução é interrompida após `limite` segundos e a
+    célula inteira retorna None.
+    """
+    tempos = []
+    for semente in sementes:
+        itens = gerar_itens(n, random.Random(semente))
+        try:
+            tempos.append(min(executar_com_limite(resolver, limite, W, V, itens)[2]
+                              if limite else resolver(W, V, itens)[2]
+                              for _ in range(repeticoes)))
+        except TempoLimiteExcedido:
+            return None
+    return statistics.median(tempos)
+
+def varrer(resolver, dimensao, grade, orcamento, sementes, repeticoes, tempo_minimo=1e-3):
+    """
+    Mede o tempo ao longo de `grade` na dimensão dada, com cada resolução
+    limitada a `orcamento` segundos. Para na primeira célula interrompida
+    (o `teto`) e, se sobrarem menos de MIN_PONTOS células com pelo menos
+    `tempo_minimo` segundos, mede os inteiros intermediários entre as células
+    já medidas e o teto (um intermediário interrompido passa a ser o teto).
+    Retorna (células medidas, teto ou None).
+    """
+    def medir(x):
+        parametros = dict(PONTO_FIXO, **{dimensao: x})
+        return medir_celula(resolver, parametros['n'], parametros['W'], parametros['V'],
+                            sementes, repeticoes, orcamento)
+
+    medidos = {}
+    teto = None
+    for x in grade:
+        tempo = medir(x)
+        if tempo is None:
+            teto = x
+            break
+        medidos[x] = tempo
+
+    while sum(t >= tempo_minimo for t in medidos.values()) < MIN_PONTOS:
+        xs = sorted(medidos) + ([teto] if teto is not None else [])
+        novos = [(a + b) // 2 for a, b in zip(xs, xs[1:])
+                 if b - a > 1 and (b == teto or medidos[b] >= tempo_minimo)]
+        if not novos:
+            break
+        for x in novos:
+            tempo = medir(x)
+            if tempo is None:
+                teto = x
+                break
+            medidos[x] = tempo
+
+    return [[x, medidos[x]] for x in sorted(medidos)], teto
+
+def regressao_linear(xs, ys):
+    """Mínimos quadrados y = a + b*x. Retorna (a, b, erro padrão de b)."""
+    k = len(xs)
+    media_x = sum(xs) / k
+    media_y = sum(ys) / k
+    sxx = sum((x - media_x) ** 2 for x in xs)
+    sxy = sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys))
+    b = sxy / sxx
+    a = media_y - b * media_x
+    residuos = sum((y - a - b * x) ** 2 for x, y in zip(xs, ys))
+    erro_b = math.sqrt(residuos / (k - 2) / sxx) if k > 2 else float('inf')
+    return a, b, erro_b
+
+def ajustar(celulas, modelo, tempo_minimo):
+    """
+    Ajusta o modelo às células (descartando tempos abaixo de `tempo_minimo`,
+    dominados por ruído). Retorna o parâmetro com IC de 95% ou None se houver
+    menos de 3 pontos úteis.
+
+    - potencia:    log t = a + k*log x  -> expoente k
+    - exponencial: log t = a + x*log b  -> base b
+    """
+    pontos = [(x, t) for x, t in celulas if t >= tempo_minimo]
+    if len(pontos) < 3:
+        return None
+
+    ys = [math.log(t) for _, t in pontos]
+    if modelo == 'potencia':
+        xs = [math.log(x) for x, _ in pontos]
+    else:
+        xs = [x for x, _ in pontos]
+
+    _, inclinacao, erro = regressao_linear(xs, ys)
+    margem = quantil_t(len(pontos) - 2) * erro
+
+    if modelo == 'potencia':
+        valor, inferior, superior = inclinacao, inclinacao - margem, inclinacao + margem
+    else:
+        valor = math.exp(inclinacao)
+        inferior = math.exp(inclinacao - margem)
+        superior = math.exp(min(inclinacao + margem, 700))
+
+    return {
+        'modelo': modelo,
+        'valor': valor,
+        'inferior': inferior,
+        'superior': superior,
+        'pontos': len(pontos),
+    }
+
+def rodar_suite(algoritmos, orcamento=1.0, sementes=(1, 2, 3), repeticoes=3,
+                tempo_minimo=1e-3):
+    """Roda todas as varreduras e retorna {algoritmo: {dimensao: {...}}}."""
+    resolvedores = carregar_resolvedores(algoritmos)
+    resultados = {}
+
+    for nome, resolver in resolvedores.items():
+        resultados[nome] = {}
+        for dimensao, (inicio, fim) in GRADES.items():
+            print(f"Varrendo {nome} em {dimensao}...")
+            celulas, teto = varrer(resolver, dimensao, grade_geometrica(inicio, fim),
+                                   orcamento, sementes, repeticoes, tempo_minimo)
+            resultados[nome][dimensao] = {
+                'celulas': celulas,
+                'teto': teto,
+                'ajuste': ajustar(celulas, MODELOS[nome][dimensao], tempo_minimo),
+            }
+
+    return resultados
+
+def imprimir_relatorio(resultados):
+    print("\n" + "="*80)
+    print("ESCALABILIDADE EMPÍRICA (IC 95%)")
+    print("="*80)
+
+    for nome, dimensoes in resultados.items():
+        print(f"\n🔹 {nome}")
+        for dimensao, dados in dimensoes.items():
+            ajuste = dados['ajuste']
+            maior = dados['celulas'][-1][0] if dados['celulas'] else None
+            teto = dados.get('teto')
+            texto_teto = f", {dimensao}={teto} passou do orçamento" if teto is not None else ""
+            if ajuste is None:
+                print(f"   {dimensao}: pontos insuficientes para o ajuste (até {dimensao}={maior}{texto_teto})")
+                continue
+
+            if ajuste['modelo'] == 'potencia':
+                forma = f"t ~ {dimensao}^k, k"
+            else:
+                forma = f"t ~ b^{dimensao}, b"
+            esperado = ESPERADO[nome][dimensao]
+            texto_esperado = f" (teórico: {esperado:g})" if esperado is not None else ""
+            print(f"   {dimensao}: {forma} = {ajuste['valor']:.3f} "
+                  f"[{ajuste['inferior']:.3f}, {ajuste['superior']:.3f}]{texto_esperado}"
+                  f" - {ajuste['pontos']} pontos, até {dimensao}={maior}{texto_teto}")
+
+def comparar_com_baseline(resultados, baseline, limiar_tempo=1.5,
+                          tolerancia_expoente=0.1, tempo_minimo=1e-3):
+    """
+    Lista as regressões em relação à baseline:
+    - mediana da razão tempo_novo/tempo_baseline acima de `limiar_tempo`
+      (só células com pelo menos `tempo_minimo` segundos na baseline);
+    - parâmetro ajustado acima do limite superior do IC da baseline +
+      tolerância (a estimativa pontual: exigir o IC inteiro acima nunca
+      dispara com os intervalos largos das buscas em árvore).
+    """
+    problemas = []
+
+    for nome, dimensoes in resultados.items():
+        for dimensao, dados in dimensoes.items():
+            base = baseline.get(nome, {}).get(dimensao)
+            if base is None:
+                continue
+
+            tempos_base = {x: t for x, t in base['celulas'] if t >= tempo_minimo}
+            razoes = [t / tempos_base[x] for x, t in dados['celulas'] if x in tempos_base]
+            if razoes and statistics.median(razoes) > limiar_tempo:
+                problemas.append(f"{nome}/{dimensao}: {statistics.median(razoes):.2f}x mais lento que a baseline")
+
+            ajuste, ajuste_base = dados['ajuste'], base['ajuste']
+            if ajuste and ajuste_base and ajuste['valor'] > ajuste_base['superior'] + tolerancia_expoente:
+                problemas.append(f"{nome}/{dimensao}: crescimento {ajuste['valor']:.3f} "
+                                 f"> baseline {ajuste_base['valor']:.3f}")
+
+    return problemas
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Suíte de escalabilidade dos algoritmos.')
+    parser.add_argument('--algoritmos', nargs='+', choices=sorted(MODELOS), default=PADRAO)
+    parser.add_argument('--orcamento', type=float, default=1.0,
+                        help='tempo (s) a partir do qual a varredura para (padrão: 1.0)')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--baseline', default=CAMINHO_BASELINE)
+    parser.add_argument('--salvar-baseline', action='store_true')
+    parser.add_argument('--verificar', action='store_true',
+                        help='compara com a baseline e retorna 1 se houver regressão')
+    parser.add_argument('--limiar', type=float, default=1.5,
+                        help='razão de tempo considerada regressão (padrão: 1.5)')
+    args = parser.parse_args(argv)
+
+    resultados = rodar_suite(args.algoritmos, args.orcamento, repeticoes=args.repeticoes)
+    imprimir_relatorio(resultados)
+
+    if args.salvar_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(resultados, f, indent=2)
+        print(f"\n✔ Baseline salva em {args.baseline}")
+
+    if args.verificar:
+        if not os.path.isfile(args.baseline):
+            print(f"\n❌ Baseline {args.baseline} não encontrada. Rode antes com --salvar-baseline.")
+            return 1
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        problemas = comparar_com_baseline(resultados, baseline, args.limiar)
+        if problemas:
+            print("\n❌ REGRESSÕES DE DESEMPENHO:")
+            for problema in problemas:
+                print(f"   {problema}")
+            return 1
+        print("\n✅ Nenhuma regressão em relação à baseline.")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
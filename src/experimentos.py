@@ -1,46 +1,83 @@
 import time
 import sys
-from utils import ler_instancia
-import algoritmos.backtracking as bt
-import algoritmos.branch_and_bound as bnb
-import algoritmos.dinamico as din
+import os
+from utils import ler_instancia, DIRETORIO_INSTANCIAS
 
-def resolver_backtracking(W, V, itens):
+# Os módulos dos algoritmos são importados dentro de cada resolver_*,
+# assim quem usa apenas um algoritmo não carrega os outros.
+
+def resolver_backtracking(W, V, itens, instrumentacao=None):
     """
     Resolve o problema da mochila usando backtracking.
+    Com `instrumentacao` (algoritmos.instrumentacao.Instrumentacao) roda a
+    versão instrumentada da busca, que preenche os contadores do objeto.
     Retorna: (melhor_valor, melhor_solucao, tempo_execucao)
     """
-    bt.melhor_valor = 0
-    bt.melhor_solucao = []
-        
+    import algoritmos.backtracking as bt
+
     n = len(itens)
+    
+    # Solução vazia é o incumbente inicial (valor 0), válida mesmo se nenhum item couber
+    bt.melhor_valor = 0
+    bt.melhor_solucao = [False] * n
     vetor = [False] * n
     
     pesos = [item[0] for item in itens]
     volumes = [item[1] for item in itens]
     valores = [item[2] for item in itens]
     
+    if instrumentacao is not None:
+        # finally: uma execução interrompida (TempoLimiteExcedido, Ctrl-C) não
+        # deixa a instrumentação ligada no módulo nem o perfil sem finalizar
+        bt.instrumentacao = instrumentacao
+        inicio = time.time()
+        try:
+            bt.backtrack_instrumentado(vetor, 0, n, W, V, pesos, volumes, valores, 0, 0)
+        finally:
+            instrumentacao.finalizar()
+            bt.instrumentacao = None
+        tempo = time.time() - inicio
+        return bt.melhor_valor, bt.melhor_solucao, tempo
+    
     inicio = time.time()
     bt.backtrack(vetor, 0, n, W, V, pesos, volumes, valores, 0, 0)
     tempo = time.time() - inicio
     
     return bt.melhor_valor, bt.melhor_solucao, tempo
 
-def resolver_branch_and_bound(W, V, itens):
+def resolver_branch_and_bound(W, V, itens, instrumentacao=None):
     """
     Resolve o problema da mochila usando branch and bound.
+    Com `instrumentacao` (algoritmos.instrumentacao.Instrumentacao) roda a
+    versão instrumentada da busca, que preenche os contadores do objeto.
     Retorna: (melhor_valor, melhor_solucao, tempo_execucao)
     """
-    bnb.melhor_valor = 0
-    bnb.melhor_solucao = []
-        
+    import algoritmos.branch_and_bound as bnb
+
     n = len(itens)
+    
+    # Solução vazia é o incumbente inicial (valor 0), válida mesmo se nenhum item couber
+    bnb.melhor_valor = 0
+    bnb.melhor_solucao = [False] * n
     vetor = [False] * n
     
     pesos = [item[0] for item in itens]
     volumes = [item[1] for item in itens]
     valores = [item[2] for item in itens]
     
+    if instrumentacao is not None:
+        # finally: uma execução interrompida (TempoLimiteExcedido, Ctrl-C) não
+        # deixa a instrumentação ligada no módulo nem o perfil sem finalizar
+        bnb.instrumentacao = instrumentacao
+        inicio = time.time()
+        try:
+            bnb.backtrack_instrumentado(vetor, 0, n, W, V, pesos, volumes, valores, 0, 0, 0)
+        finally:
+            instrumentacao.finalizar()
+            bnb.instrumentacao = None
+        tempo = time.time() - inicio
+        return bnb.melhor_valor, bnb.melhor_solucao, tempo
+    
     inicio = time.time()
     bnb.backtrack(vetor, 0, n, W, V, pesos, volumes, valores, 0, 0, 0)
     tempo = time.time() - inicio
@@ -51,6 +88,8 @@ def resolver_dinamico(W, V, itens):
     """
     Resolve o problema com programação dinâmica
     """
+    import algoritmos.dinamico as din
+
     n = len(itens)
     
     pesos = [0] + [item[0] for item in itens]
@@ -63,6 +102,50 @@ def resolver_dinamico(W, V, itens):
     
     return melhor_valor, melhor_solucao, tempo
 
+def resolver_dinamico_memmap(W, V, itens):
+    """
+    Resolve o problema com programação dinâmica fora da memória
+    (camada em dtype estreito + bits de decisão em np.memmap).
+    """
+    import algoritmos.dinamico_memmap as dinm
+
+    n = len(itens)
+    
+    pesos = [0] + [item[0] for item in itens]
+    volumes = [0] + [item[1] for item in itens]
+    valores = [0] + [item[2] for item in itens]
+    
+    inicio = time.time()
+    melhor_valor, melhor_solucao = dinm.dinamico_memmap(W, V, n, pesos, volumes, valores)
+    tempo = time.time() - inicio
+    
+    return melhor_valor, melhor_solucao, tempo
+
+def resolver_auto(W, V, itens, corrida=False):
+    """
+    Escolhe o algoritmo com menor tempo previsto (selecao.py: modelo de custo
+    calibrado ou regra de pior caso) e resolve com ele. Com corrida=True roda
+    os dois melhores candidatos em paralelo e fica com o primeiro que terminar;
+    se só um tiver custo previsto finito, resolve só com ele.
+    O algoritmo usado fica em selecao.ultima_escolha.
+    Retorna: (melhor_valor, melhor_solucao, tempo_execucao)
+    """
+    import selecao
+
+    inicio = time.time()
+    candidatos = selecao.escolher_algoritmos(W, V, itens, quantidade=2 if corrida else 1)
+    if len(candidatos) > 1:
+        algoritmo, melhor_valor, melhor_solucao = selecao.correr(candidatos, W, V, itens)
+    else:
+        # Sem corrida, ou só um candidato com custo previsto finito
+        algoritmo = candidatos[0]
+        resolver_func = globals()[selecao.RESOLVEDORES[algoritmo]]
+        melhor_valor, melhor_solucao, _ = resolver_func(W, V, itens)
+    tempo = time.time() - inicio
+    
+    selecao.ultima_escolha = algoritmo
+    return melhor_valor, melhor_solucao, tempo
+
 def testar_instancia(caminho_arquivo, resolver_func, nome_algoritmo):
     """Testa uma única instância com o algoritmo especificado."""
     print(f"\nTestando: {caminho_arquivo}")
@@ -93,7 +176,8 @@ def main():
     algoritmos = {
         '1': (resolver_backtracking, 'Backtracking'),
         '2': (resolver_branch_and_bound, 'Branch and Bound'),
-        '3': (resolver_dinamico, 'Programação Dinâmica')
+        '3': (resolver_dinamico, 'Programação Dinâmica'),
+        '4': (resolver_auto, 'Seleção Automática')
     }
     
     # Verifica se foi passado argumento na linha de comando
@@ -105,6 +189,7 @@ def main():
         print("1 - Backtracking")
         print("2 - Branch and Bound")
         print("3 - Programação Dinâmica")
+        print("4 - Seleção Automática")
         escolha = input("Digite o número do algoritmo: ")
     
     if escolha not in algoritmos:
@@ -117,7 +202,7 @@ def main():
     
     # Instâncias de teste
     instancias = [
-        "../instancias/W200_V200/instancia_n30.txt",
+        os.path.join(DIRETORIO_INSTANCIAS, "W200_V200", "instancia_n30.txt"),
         # "../instancias/W100_V50/instancia_n100.txt",
         # "../instancias/W50_V100/instancia_n30.txt",  # Descomente com cuidado
     ]
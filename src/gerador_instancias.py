@@ -1,33 +1,35 @@
 import random
 import os
 import sys
+from utils import DIRETORIO_INSTANCIAS
+
+def gerar_itens(n, rng=random):
+    """Sorteia n itens (peso, volume, valor) com a mesma distribuição dos arquivos."""
+    itens = []
+    for _ in range(n):
+        # Itens com peso e volume proporcionais à mochila
+        # peso = rng.randint(1, max(2, W // 4))
+        peso = rng.randint(1, 10)
+        # volume = rng.randint(1, max(2, V // 4))
+        volume = rng.randint(1, 10)
+        valor = rng.randint(10, 100)
+        itens.append((peso, volume, valor))
+    return itens
 
 def gerar_instancia(n, W, V, nome_arquivo):
     """Gera uma única instância seguindo o formato do trabalho."""
     with open(nome_arquivo, 'w') as f:
         f.write(f"{W}\t{V}\n")
         
-        for _ in range(n):
-            # Itens com peso e volume proporcionais à mochila
-            # peso = random.randint(1, max(2, W // 4))
-            peso = random.randint(1, 10)
-            # volume = random.randint(1, max(2, V // 4))
-            volume = random.randint(1, 10)
-            valor = random.randint(10, 100)
+        for peso, volume, valor in gerar_itens(n):
             f.write(f"{peso}\t{volume}\t{valor}\n")
 
-def main():
-    if len(sys.argv) < 3:
-        print("Uso: python3 gerador_instancias.py <peso_max> <volume_max>")
-        sys.exit(1)
-
-    W = int(sys.argv[1])
-    V = int(sys.argv[2])
-    
+def gerar_conjunto(W, V, lista_n=None, base_path=DIRETORIO_INSTANCIAS):
+    """Gera uma pasta W{W}_V{V} com uma instância para cada n de lista_n."""
     # Queremos uma instância para cada um destes tamanhos
-    lista_n = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+    if lista_n is None:
+        lista_n = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
 
-    base_path = os.path.join("..", "instancias")
     # Criamos uma pasta única para esse conjunto de testes
     nome_pasta = f"W{W}_V{V}"
     pasta_caminho = os.path.join(base_path, nome_pasta)
@@ -35,13 +37,23 @@ def main():
     if not os.path.exists(pasta_caminho):
         os.makedirs(pasta_caminho)
 
-    print(f"Gerando instâncias variando N de 10 a 100 em: {nome_pasta}")
+    print(f"Gerando instâncias variando N de {min(lista_n)} a {max(lista_n)} em: {nome_pasta}")
     
     for n in lista_n:
         nome_arq = os.path.join(pasta_caminho, f"instancia_n{n}.txt")
         gerar_instancia(n, W, V, nome_arq)
 
-    print("\nConcluído! Você tem 10 arquivos, cada um com um número diferente de itens.")
+    print(f"\nConcluído! Você tem {len(lista_n)} arquivos, cada um com um número diferente de itens.")
+
+def main():
+    if len(sys.argv) < 3:
+        print("Uso: python3 gerador_instancias.py <peso_max> <volume_max>")
+        sys.exit(1)
+
+    W = int(sys.argv[1])
+    V = int(sys.argv[2])
+
+    gerar_conjunto(W, V)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Ponto de entrada único do trabalho prático.
+
+Uso (de qualquer diretório):
+    python3 src/knapsack.py solve <instancia> [-a ALGORITMO] [--corrida] [--perfil ARQ.json [--amostragem K]]
+    python3 src/knapsack.py bench [PASTA ...]
+    python3 src/knapsack.py analyze [--resultados DIR] [--graficos DIR] [--perfil ARQ.json|PASTA ...]
+    python3 src/knapsack.py generate <peso_max> <volume_max> [-n N ...]
+    python3 src/knapsack.py calibrate [--limite S | --csv]
+    python3 src/knapsack.py scaling [--salvar-baseline] [--verificar] [...]
+    python3 src/knapsack.py verify [--salvar-baseline] [--verificar-tempo] [...]
+    python3 src/knapsack.py serve [--porta P | --unix CAMINHO] [--trabalhadores N] [...]
+
+Cada subcomando importa apenas o que usa: `solve` carrega só o módulo do
+algoritmo escolhido, e pandas/matplotlib/seaborn só entram em `analyze`.
+"""
+
+import argparse
+import os
+import sys
+
+# Nome na linha de comando -> (função em experimentos.py, nome exibido)
+ALGORITMOS = {
+    'dinamico': ('resolver_dinamico', 'Programação Dinâmica'),
+    'backtracking': ('resolver_backtracking', 'Backtracking'),
+    'branch_and_bound': ('resolver_branch_and_bound', 'Branch and Bound'),
+    'dinamico_memmap': ('resolver_dinamico_memmap', 'Programação Dinâmica (memmap)'),
+    'auto': ('resolver_auto', 'Seleção Automática'),
+}
+
+# Algoritmos com versão instrumentada (algoritmos/instrumentacao.py)
+INSTRUMENTAVEIS = {'backtracking', 'branch_and_bound'}
+
+# Mesmas pastas usadas por padrão em benchmark.py
+PASTAS_BENCHMARK = ["W30_V40", "W50_V100", "W80_V80", "W70_V100"]
+
+def comando_solve(args):
+    """Resolve uma única instância e imprime a saída pedida no trabalho."""
+    import experimentos
+    from utils import ler_instancia
+
+    if not os.path.isfile(args.instancia):
+        print(f"Erro: Arquivo {args.instancia} não encontrado.")
+        return 1
+
+    # ler_instancia já imprime o motivo quando o arquivo não está no formato
+    if ler_instancia(args.instancia) is None:
+        print(f"Erro: {args.instancia} não é uma instância válida.")
+        return 1
+
+    if args.corrida and args.algoritmo != 'auto':
+        print("Erro: --corrida só está disponível com -a auto.")
+        return 1
+    if (args.perfil or args.amostragem) and args.algoritmo not in INSTRUMENTAVEIS:
+        print(f"Erro: --perfil só está disponível para {', '.join(sorted(INSTRUMENTAVEIS))}.")
+        return 1
+    if args.amostragem and not args.perfil:
+        print("Erro: --amostragem só tem efeito com --perfil.")
+        return 1
+
+    nome_func, nome_algoritmo = ALGORITMOS[args.algoritmo]
+    resolver = getattr(experimentos, nome_func)
+
+    if args.algoritmo == 'auto':
+        import selecao
+
+        experimentos.testar_instancia(
+            args.instancia,
+            lambda W, V, itens: resolver(W, V, itens, corrida=args.corrida),
+            nome_algoritmo
+        )
+        print(f"Algoritmo escolhido: {selecao.ultima_escolha}")
+        return 0
+
+    if not args.perfil:
+        experimentos.testar_instancia(args.instancia, resolver, nome_algoritmo)
+        return 0
+
+    from algoritmos.instrumentacao import Instrumentacao
+
+    _, _, itens = ler_instancia(args.instancia)
+    instrumentacao = Instrumentacao(len(itens), amostragem=args.amostragem)
+    experimentos.testar_instancia(
+        args.instancia,
+        lambda W, V, itens: resolver(W, V, itens, instrumentacao),
+        nome_algoritmo
+    )
+    instrumentacao.imprimir()
+    instrumentacao.salvar(args.perfil, instancia=args.instancia, algoritmo=nome_algoritmo)
+    print(f"✔ Perfil salvo em {args.perfil}")
+    return 0
+
+def comando_bench(args):
+    """Roda o benchmark completo (10 execuções por instância) nas pastas dadas."""
+    from benchmark import rodar_benchmark
+
+    rodar_benchmark(args.pastas or PASTAS_BENCHMARK)
+    return 0
+
+def comando_analyze(args):
+    """Gera as tabelas e gráficos a partir dos CSVs de resultados."""
+    import analise_resultados
+
+    if args.perfil:
+        os.makedirs(args.graficos, exist_ok=True)
+        for caminho in args.perfil:
+            if not os.path.isdir(caminho):
+                analise_resultados.plotar_perfil_busca(caminho, pasta_graficos=args.graficos)
+                continue
+            # Pasta de perfis: tabela comparativa e um gráfico por perfil
+            df = analise_resultados.carregar_perfis(caminho)
+            if df is None:
+                return 1
+            analise_resultados.gerar_tabela_perfis(df, args.graficos)
+            for arquivo in df['Arquivo']:
+                analise_resultados.plotar_perfil_busca(os.path.join(caminho, arquivo),
+                                                       pasta_graficos=args.graficos)
+        return 0
+
+    analise_resultados.main(args.resultados, args.graficos)
+    return 0
+
+def comando_generate(args):
+    """Gera uma pasta de instâncias W{W}_V{V}."""
+    from gerador_instancias import gerar_conjunto
+
+    gerar_conjunto(args.peso_max, args.volume_max, args.n)
+    return 0
+
+def comando_calibrate(args):
+    """Calibra o modelo de custo de `-a auto` medindo os algoritmos atuais (ou com os CSVs)."""
+    import selecao
+
+    if args.csv:
+        modelo = selecao.calibrar()
+        selecao.salvar_modelo(modelo, 'csv')
+    else:
+        modelo = selecao.calibrar_por_medicao(limite=args.limite)
+        selecao.salvar_modelo(modelo, 'medicao')
+
+    for algoritmo in selecao.ALGORITMOS_CANDIDATOS:
+        coeficientes = modelo['coeficientes'].get(algoritmo)
+        texto = ', '.join(f'{c:.4f}' for c in coeficientes) if coeficientes else 'sem dados (nunca escolhido)'
+        limite = modelo['limites'].get(algoritmo)
+        texto_limite = f" - estoura a partir de tamanho {limite:.4g}" if limite is not None else ""
+        print(f"{algoritmo}: {texto}{texto_limite}")
+    print(f"✔ Modelo salvo em {selecao.CAMINHO_MODELO}")
+    return 0
+
+def comando_scaling(args):
+    """Roda a suíte de escalabilidade (opções repassadas a escalabilidade.py)."""
+    import escalabilidade
+
+    return escalabilidade.main(args.opcoes)
+
+def comando_verify(args):
+    """Verificação diferencial (opções repassadas a verificacao.py)."""
+    import verificacao
+
+    return verificacao.main(args.opcoes)
+
+def comando_serve(args):
+    """Sobe o serviço local (opções repassadas a servico.py)."""
+    import servico
+
+    return servico.main(args.opcoes)
+
+def criar_parser():
+    from utils import DIRETORIO_RESULTADOS, DIRETORIO_GRAFICOS
+
+    parser = argparse.ArgumentParser(
+        prog='knapsack',
+        description='Mochila 0-1 com duas restrições (peso e volume).'
+    )
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p = sub.add_parser('solve', help='resolve uma instância')
+    p.add_argument('instancia', help='arquivo no formato de ler_instancia')
+    p.add_argument('-a', '--algoritmo', choices=sorted(ALGORITMOS), default='branch_and_bound')
+    p.add_argument('--corrida', action='store_true',
+                   help='com -a auto, roda os dois melhores candidatos em paralelo e fica com o primeiro')
+    p.add_argument('--perfil', metavar='ARQ.json',
+                   help='roda a busca instrumentada e salva o perfil (backtracking/branch_and_bound)')
+    p.add_argument('--amostragem', type=int, default=0, metavar='K',
+                   help='guarda 1 de cada K eventos no trace do perfil (0 = sem trace)')
+    p.set_defaults(func=comando_solve)
+
+    p = sub.add_parser('bench', help='roda o benchmark e salva os CSVs')
+    p.add_argument('pastas', nargs='*', help=f'pastas em instancias/ (padrão: {" ".join(PASTAS_BENCHMARK)})')
+    p.set_defaults(func=comando_bench)
+
+    p = sub.add_parser('analyze', help='gera gráficos a partir dos CSVs')
+    p.add_argument('--resultados', default=DIRETORIO_RESULTADOS)
+    p.add_argument('--graficos', default=DIRETORIO_GRAFICOS)
+    p.add_argument('--perfil', nargs='+', metavar='ARQ.json|PASTA',
+                   help='gera os gráficos de perfis salvos por solve --perfil; '
+                        'para uma pasta, também a tabela comparativa dos perfis')
+    p.set_defaults(func=comando_analyze)
+
+    p = sub.add_parser('generate', help='gera instâncias aleatórias')
+    p.add_argument('peso_max', type=int)
+    p.add_argument('volume_max', type=int)
+    p.add_argument('-n', type=int, nargs='+', default=None, help='tamanhos (padrão: 10, 20, ..., 100)')
+    p.set_defaults(func=comando_generate)
+
+    p = sub.add_parser('calibrate', help='calibra a seleção automática medindo os algoritmos')
+    p.add_argument('--limite', type=float, default=0.5,
+                   help='tempo máximo (s) por execução; acima disso a instância marca o limite do algoritmo')
+    p.add_argument('--csv', action='store_true',
+                   help='ajusta com os CSVs de resultados/ em vez de medir (use só se foram gerados com o código atual)')
+    p.set_defaults(func=comando_calibrate)
+
+    # As opções de `scaling`, `verify` e `serve` são repassadas sem mudança para o main do módulo
+    p = sub.add_parser('scaling', help='suíte de escalabilidade / checagem de regressão',
+                       add_help=False)
+    p.set_defaults(func=comando_scaling, repassa_opcoes=True)
+
+    p = sub.add_parser('verify', help='confere corretude e desempenho de todos os algoritmos',
+                       add_help=False)
+    p.set_defaults(func=comando_verify, repassa_opcoes=True)
+
+    p = sub.add_parser('serve', help='serviço local com pool de trabalhadores', add_help=False)
+    p.set_defaults(func=comando_serve, repassa_opcoes=True)
+
+    return parser
+
+def main(argv=None):
+    parser = criar_parser()
+    args, opcoes = parser.parse_known_args(argv)
+    if opcoes and not getattr(args, 'repassa_opcoes', False):
+        parser.error(f"argumentos não reconhecidos: {' '.join(opcoes)}")
+    args.opcoes = opcoes
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+"""
+Seleção automática de algoritmo a partir de características da instância.
+
+Para cada instância calcula atributos baratos (n, quantos itens cabem juntos
+dadas as duas capacidades, tamanho estimado da árvore de busca, células da PD
+e correlação valor x tamanho) e escolhe o algoritmo com menor tempo previsto.
+
+Sem modelo calibrado vale uma regra de pior caso (regra_padrao): a PD custa
+n (W+1) (V+1) células e as buscas em árvore no máximo n * árvore nós; fica o
+menor. Ela nunca escolhe uma busca cuja árvore possa explodir.
+
+`knapsack.py calibrate` mede os algoritmos atuais nas instâncias de
+instancias/ e ajusta um modelo de custo log-linear:
+
+- Dinamico:          log t = a + b * log(n (W+1) (V+1))
+- Backtracking, B&B: log t = a + b * log2(árvore) + c * correlação
+
+Execuções interrompidas pelo limite de tempo não entram no ajuste (o tempo
+real é desconhecido, só se sabe que passa do limite): elas definem, por
+algoritmo, o menor tamanho a partir do qual o custo previsto é infinito.
+Com `calibrate --csv` o ajuste usa os CSVs de resultados/ (só faz sentido se
+foram gerados com o código atual). O modelo fica em resultados/modelo_custo.json.
+"""
+
+import csv
+import json
+import math
+import os
+import statistics
+from pathlib import Path
+from utils import ler_instancia, executar_com_limite, TempoLimiteExcedido, DIRETORIO_INSTANCIAS, DIRETORIO_RESULTADOS
+
+CAMINHO_MODELO = os.path.join(DIRETORIO_RESULTADOS, "modelo_custo.json")
+
+ALGORITMOS_CANDIDATOS = ('Dinamico', 'Backtracking', 'Branch_and_Bound')
+
+# Nome nos CSVs -> função em experimentos.py
+RESOLVEDORES = {
+    'Dinamico': 'resolver_dinamico',
+    'Backtracking': 'resolver_backtracking',
+    'Branch_and_Bound': 'resolver_branch_and_bound',
+}
+
+_modelo = None
+
+# Último algoritmo escolhido por resolver_auto (para exibir ao usuário)
+ultima_escolha = None
+
+def extrair_atributos(W, V, itens):
+    """Atributos baratos (O(n log n)) usados pelo modelo de custo."""
+    n = len(itens)
+    pesos = [item[0] for item in itens]
+    volumes = [item[1] for item in itens]
+    valores = [item[2] for item in itens]
+
+    # Quantos itens cabem juntos, pegando primeiro os menores
+    tamanhos = sorted(itens, key=lambda item: max(item[0] / max(W, 1), item[1] / max(V, 1)))
+    cabem, peso, volume = 0, 0, 0
+    for p, l, _ in tamanhos:
+        if peso + p > W or volume + l > V:
+            break
+        peso, volume, cabem = peso + p, volume + l, cabem + 1
+
+    # Nós da árvore de busca ~ subconjuntos com até `cabem` itens
+    arvore = sum(math.comb(n, i) for i in range(cabem + 1))
+
+    tamanho_normalizado = [p / max(W, 1) + l / max(V, 1) for p, l in zip(pesos, volumes)]
+    try:
+        correlacao = statistics.correlation(valores, tamanho_normalizado)
+    except statistics.StatisticsError:
+        correlacao = 0.0
+
+    return {
+        'n': n,
+        'correlacao': correlacao,
+        'itens_que_cabem': cabem,
+        'log2_arvore': math.log2(arvore),
+        'celulas_dp': n * (W + 1) * (V + 1),
+    }
+
+def _tamanho(algoritmo, atributos):
+    """Medida de tamanho da instância para o algoritmo (a que domina seu custo)."""
+    if algoritmo == 'Dinamico':
+        return atributos['celulas_dp']
+    return atributos['log2_arvore']
+
+def _regressores(algoritmo, atributos):
+    if algoritmo == 'Dinamico':
+        return [1.0, math.log(max(atributos['celulas_dp'], 1))]
+    return [1.0, atributos['log2_arvore'], atributos['correlacao']]
+
+def regra_padrao(atributos):
+    """
+    Ordem dos algoritmos sem modelo calibrado: compara o custo exato da PD
+    (células) com o pior caso das buscas (n * nós da árvore estimada).
+    """
+    custo_arvore = atributos['n'] * 2 ** atributos['log2_arvore']
+    if custo_arvore < atributos['celulas_dp']:
+        return ['Branch_and_Bound', 'Dinamico', 'Backtracking']
+    return ['Dinamico', 'Branch_and_Bound', 'Backtracking']
+
+def minimos_quadrados(X, y):
+    """Resolve as equações normais (X'X) b = X'y por eliminação de Gauss."""
+    k = len(X[0])
+    A = [[sum(linha[i] * linha[j] for linha in X) for j in range(k)] +
+         [sum(linha[i] * alvo for linha, alvo in zip(X, y))] for i in range(k)]
+
+    for coluna in range(k):
+        pivo = max(range(coluna, k), key=lambda i: abs(A[i][coluna]))
+        if abs(A[pivo][coluna]) < 1e-12:
+            raise ValueError("sistema singular")
+        A[coluna], A[pivo] = A[pivo], A[coluna]
+        for i in range(k):
+            if i != coluna:
+                fator = A[i][coluna] / A[coluna][coluna]
+                A[i] = [a - fator * b for a, b in zip(A[i], A[coluna])]
+
+    return [A[i][k] / A[i][i] for i in range(k)]
+
+def _obter_atributos(cache, pasta_instancias, W, V, n):
+    chave = (W, V, n)
+    if chave not in cache:
+        caminho = os.path.join(pasta_instancias, f"W{W}_V{V}", f"instancia_n{n}.txt")
+        instancia = ler_instancia(caminho) if os.path.isfile(caminho) else None
+        cache[chave] = extrair_atributos(*instancia) if instancia else None
+    return cache[chave]
+
+def _ajustar(amostras, limites=None):
+    """
+    amostras: {algoritmo: [(atributos, tempo), ...]} (só execuções completas);
+    limites: {algoritmo: menor tamanho que estourou o tempo}.
+
+    Retorna {'coeficientes': {...}, 'limites': {...}}. Um algoritmo com menos
+    amostras que o dobro de coeficientes fica sem coeficientes (custo infinito).
+    """
+    coeficientes = {}
+    for algoritmo in ALGORITMOS_CANDIDATOS:
+        pontos = amostras.get(algoritmo, [])
+        X = [_regressores(algoritmo, atributos) for atributos, _ in pontos]
+        if X and len(X) >= 2 * len(X[0]):
+            try:
+                coeficientes[algoritmo] = minimos_quadrados(X, [math.log(tempo) for _, tempo in pontos])
+            except ValueError:
+                pass
+    return {'coeficientes': coeficientes, 'limites': dict(limites or {})}
+
+def calibrar(pasta_resultados=DIRETORIO_RESULTADOS, pasta_instancias=DIRETORIO_INSTANCIAS):
+    """
+    Ajusta os coeficientes de cada algoritmo com os CSVs de resultados.
+    Os CSVs não registram execuções interrompidas, então não há limites.
+    """
+    amostras = {nome: [] for nome in ALGORITMOS_CANDIDATOS}
+    atributos_cache = {}
+
+    for arquivo in sorted(Path(pasta_resultados).glob('resultados_*.csv')):
+        with open(arquivo, newline='') as f:
+            for linha in csv.DictReader(f):
+                algoritmo = linha['Algoritmo']
+                tempo = float(linha['Tempo_Medio'])
+                if algoritmo not in amostras or tempo <= 0:
+                    continue
+                atributos = _obter_atributos(atributos_cache, pasta_instancias, linha['Capacidade_W'],
+                                             linha['Capacidade_V'], linha['N_Itens'])
+                if atributos is not None:
+                    amostras[algoritmo].append((atributos, tempo))
+
+    return _ajustar(amostras)
+
+def calibrar_por_medicao(pasta_instancias=DIRETORIO_INSTANCIAS, limite=0.5):
+    """
+    Ajusta o modelo medindo os algoritmos atuais nas instâncias de
+    instancias/ (os CSVs podem ter sido gerados com outra versão do código).
+    Execuções que passam de `limite` segundos são interrompidas; elas e os n
+    maiores da mesma pasta para aquele algoritmo ficam fora do ajuste e
+    definem o limite de tamanho do algoritmo.
+    """
+    import experimentos
+
+    amostras = {nome: [] for nome in ALGORITMOS_CANDIDATOS}
+    limites = {}
+    for pasta in sorted(os.listdir(pasta_instancias)):
+        caminho_pasta = os.path.join(pasta_instancias, pasta)
+        if not os.path.isdir(caminho_pasta):
+            continue
+        instancias = []
+        for arquivo in os.listdir(caminho_pasta):
+            if arquivo.startswith('instancia_n') and arquivo.endswith('.txt'):
+                instancia = ler_instancia(os.path.join(caminho_pasta, arquivo))
+                if instancia:
+                    instancias.append(instancia)
+        instancias.sort(key=lambda instancia: len(instancia[2]))
+        print(f"Medindo {pasta}...")
+
+        for algoritmo in ALGORITMOS_CANDIDATOS:
+            resolver_func = getattr(experimentos, RESOLVEDORES[algoritmo])
+            estourado = False
+            for W, V, itens in instancias:
+                atributos = extrair_atributos(W, V, itens)
+                if not estourado:
+                    try:
+                        tempo = executar_com_limite(resolver_func, limite, W, V, itens)[2]
+                        amostras[algoritmo].append((atributos, max(tempo, 1e-6)))
+                        continue
+                    except (TempoLimiteExcedido, RecursionError):
+                        estourado = True
+                tamanho = _tamanho(algoritmo, atributos)
+                limites[algoritmo] = min(limites.get(algoritmo, tamanho), tamanho)
+
+    return _ajustar(amostras, limites)
+
+def salvar_modelo(modelo, origem):
+    global _modelo
+    os.makedirs(os.path.dirname(CAMINHO_MODELO), exist_ok=True)
+    with open(CAMINHO_MODELO, 'w') as f:
+        json.dump({'origem': origem, **modelo}, f, indent=2)
+    _modelo = modelo
+
+def obter_modelo():
+    """
+    Modelo salvo por `knapsack.py calibrate`, lido uma vez por processo.
+    None se ainda não houve calibração (vale a regra_padrao).
+    """
+    global _modelo
+    if _modelo is None:
+        try:
+            with open(CAMINHO_MODELO) as f:
+                salvo = json.load(f)
+            _modelo = {'coeficientes': salvo['coeficientes'], 'limites': salvo['limites']}
+        except (OSError, ValueError, KeyError):
+            return None
+    return _modelo
+
+def prever_tempos(W, V, itens, modelo):
+    """
+    Tempo previsto (s) de cada algoritmo candidato; infinito para os sem
+    coeficientes ou com a instância no limite de tamanho ou acima dele.
+    """
+    atributos = extrair_atributos(W, V, itens)
+    previsoes = {}
+    for algoritmo in ALGORITMOS_CANDIDATOS:
+        coeficientes = modelo['coeficientes'].get(algoritmo)
+        limite = modelo['limites'].get(algoritmo)
+        if coeficientes is None or (limite is not None and _tamanho(algoritmo, atributos) >= limite):
+            previsoes[algoritmo] = math.inf
+        else:
+            log_tempo = sum(c * x for c, x in zip(coeficientes, _regressores(algoritmo, atributos)))
+            previsoes[algoritmo] = math.exp(min(log_tempo, 700))
+    return previsoes
+
+def escolher_algoritmos(W, V, itens, quantidade=1):
+    """
+    Até `quantidade` algoritmos com menor tempo previsto, do mais rápido ao
+    mais lento. Os com custo previsto infinito ficam de fora (a corrida não
+    gasta um processo com eles); se todos forem infinitos, só a PD (também
+    vence os empates). Sem modelo calibrado usa a regra_padrao.
+    """
+    modelo = obter_modelo()
+    if modelo is None:
+        return regra_padrao(extrair_atributos(W, V, itens))[:quantidade]
+    previsoes = prever_tempos(W, V, itens, modelo)
+    ordem = sorted(previsoes, key=previsoes.get)
+    finitos = [algoritmo for algoritmo in ordem if previsoes[algoritmo] < math.inf]
+    return (finitos or ordem[:1])[:quantidade]
+
+# ---- Corrida -------------------------------------------------------------
+
+def _correr(nome_func, W, V, itens, conexao):
+    import experimentos
+
+    conexao.send(getattr(experimentos, nome_func)(W, V, itens)[:2])
+    conexao.close()
+
+def correr(algoritmos, W, V, itens):
+    """
+    Roda os algoritmos em paralelo, cada um em um processo, e fica com o
+    primeiro que terminar (os outros são encerrados).
+    Retorna (algoritmo_vencedor, melhor_valor, melhor_solucao).
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait
+
+    conexoes = {}
+    processos = []
+    for algoritmo in algoritmos:
+        leitura, escrita = multiprocessing.Pipe(duplex=False)
+        processo = multiprocessing.Process(target=_correr,
+                                           args=(RESOLVEDORES[algoritmo], W, V, itens, escrita))
+        processo.start()
+        escrita.close()
+        conexoes[leitura] = algoritmo
+        processos.append(processo)
+
+    try:
+        pendentes = list(conexoes)
+        while pendentes:
+            for conexao in wait(pendentes):
+                try:
+                    melhor_valor, melhor_solucao = conexao.recv()
+                except EOFError:
+                    # Processo morreu sem resposta (ex.: RecursionError): espera o outro
+                    pendentes.remove(conexao)
+                    continue
+                return conexoes[conexao], melhor_valor, melhor_solucao
+        raise RuntimeError("nenhum algoritmo da corrida terminou")
+    finally:
+        for processo in processos:
+            if processo.is_alive():
+                processo.kill()
+            processo.join()
+        for conexao in conexoes:
+            conexao.close()
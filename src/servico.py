@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Serviço local de resolução: servidor asyncio (HTTP/1.1 em localhost ou em um
+socket Unix) que despacha as instâncias para um pool de processos já aquecidos,
+sem pagar a inicialização do interpretador e dos imports a cada chamada.
+
+    POST /solve?algoritmo=branch_and_bound&timeout=5   (ou algoritmo=auto)
+        corpo: instância no formato de ler_instancia (texto) ou, com
+        Content-Type: application/octet-stream, o formato binário de
+        codificar_binario (uint32 little-endian: W, V, n e n triplas).
+        resposta: {"algoritmo", "valor", "itens", "tempo"}
+    GET /status
+        contadores do serviço
+
+- Cada trabalhador importa os módulos dos algoritmos ao iniciar.
+- O timeout conta desde a chegada do pedido, inclusive a espera na fila por
+  um trabalhador livre. Um pedido que passa do timeout durante a execução tem
+  o processo do seu trabalhador morto e substituído por um novo (504); os
+  outros pedidos não são afetados.
+- Backpressure: com `max_pendentes` resoluções em fila/execução, novos
+  pedidos recebem 503 na hora em vez de aumentar a fila.
+- Pedidos idênticos (mesmo algoritmo e instância) em andamento são
+  resolvidos uma vez só e compartilham o resultado. Cada um espera até o
+  próprio timeout, e a resolução só é interrompida no prazo mais distante.
+
+Uso:
+    python3 servico.py --porta 8765 --trabalhadores 4
+    python3 servico.py --unix /tmp/mochila.sock
+    curl --data-binary @instancias/W20_V30/instancia_n10.txt 'localhost:8765/solve?algoritmo=dinamico'
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import struct
+import sys
+from urllib.parse import urlsplit, parse_qs
+from knapsack import ALGORITMOS
+from utils import interpretar_instancia
+
+# Trabalhadores saem de um forkserver, não de fork() do servidor: um processo
+# criado com o loop rodando herdaria o socket de escuta e as conexões abertas,
+# e fechar uma conexão no servidor não mandaria EOF ao cliente.
+CONTEXTO = multiprocessing.get_context('forkserver')
+
+MOTIVOS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error',
+           503: 'Service Unavailable', 504: 'Gateway Timeout'}
+
+class Sobrecarga(Exception):
+    """Fila de pendentes cheia (backpressure)."""
+
+class TempoEsgotado(Exception):
+    """A resolução passou do timeout do pedido."""
+
+# ---- Formato binário -----------------------------------------------------
+
+def codificar_binario(W, V, itens):
+    """Instância em bytes: uint32 W, V, n e (peso, volume, valor) por item."""
+    dados = [W, V, len(itens)]
+    for item in itens:
+        dados.extend(item)
+    return struct.pack(f'<{len(dados)}I', *dados)
+
+def decodificar_binario(dados):
+    if len(dados) < 12:
+        raise ValueError("instância binária sem cabeçalho (W, V, n)")
+    W, V, n = struct.unpack_from('<3I', dados)
+    if len(dados) != 12 + 12 * n:
+        raise ValueError(f"instância binária com {len(dados)} bytes, esperado {12 + 12 * n}")
+    return W, V, list(struct.iter_unpack('<3I', dados[12:]))
+
+# ---- Trabalhadores -------------------------------------------------------
+
+def _laco_trabalhador(conexao):
+    """Processo trabalhador: importa os algoritmos uma vez e atende tarefas."""
+    import experimentos
+    import algoritmos.backtracking
+    import algoritmos.branch_and_bound
+    import algoritmos.dinamico
+    try:
+        import algoritmos.dinamico_memmap
+    except ImportError:
+        pass
+    import selecao
+    selecao.obter_modelo()
+
+    while True:
+        try:
+            nome_func, W, V, itens = conexao.recv()
+        except EOFError:
+            return
+        try:
+            valor, solucao, tempo = getattr(experimentos, nome_func)(W, V, itens)
+            conexao.send(('ok', valor, solucao, tempo))
+        except Exception as e:
+            conexao.send(('erro', repr(e)))
+
+class Trabalhador:
+    def __init__(self):
+        self.conexao, conexao_filho = CONTEXTO.Pipe()
+        self.processo = CONTEXTO.Process(target=_laco_trabalhador, args=(conexao_filho,),
+                                         daemon=True)
+        self.processo.start()
+        conexao_filho.close()
+
+    async def executar(self, tarefa, aguardar):
+        """
+        Manda a tarefa e espera a resposta com `aguardar(futuro)`, que retorna
+        False se o prazo acabou (levanta asyncio.TimeoutError nesse caso).
+        """
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        fd = self.conexao.fileno()
+
+        def resposta_pronta():
+            loop.remove_reader(fd)
+            try:
+                resposta = self.conexao.recv()
+            except EOFError:
+                resposta = ('erro', 'trabalhador encerrado')
+            if not futuro.done():
+                futuro.set_result(resposta)
+
+        self.conexao.send(tarefa)
+        loop.add_reader(fd, resposta_pronta)
+        try:
+            if not await aguardar(futuro):
+                raise asyncio.TimeoutError()
+            return futuro.result()
+        finally:
+            loop.remove_reader(fd)
+
+    def encerrar(self):
+        self.processo.kill()
+        self.processo.join()
+        self.conexao.close()
+
+# ---- Serviço -------------------------------------------------------------
+
+class ServicoMochila:
+    def __init__(self, trabalhadores=None, max_pendentes=None, timeout_padrao=10.0, timeout_max=60.0):
+        self.n_trabalhadores = trabalhadores or os.cpu_count() or 1
+        self.max_pendentes = max_pendentes or 32 * self.n_trabalhadores
+        self.timeout_padrao = timeout_padrao
+        self.timeout_max = timeout_max
+        self.trabalhadores = []
+        self.ociosos = None
+        self.em_andamento = {}
+        self.pendentes = 0
+        self.contadores = {'atendidas': 0, 'deduplicadas': 0, 'rejeitadas': 0, 'tempos_esgotados': 0}
+
+    def iniciar(self):
+        self.ociosos = asyncio.Queue()
+        for _ in range(self.n_trabalhadores):
+            trabalhador = Trabalhador()
+            self.trabalhadores.append(trabalhador)
+            self.ociosos.put_nowait(trabalhador)
+
+    def encerrar(self):
+        for trabalhador in self.trabalhadores:
+            trabalhador.encerrar()
+        self.trabalhadores = []
+
+    def _substituir(self, trabalhador):
+        trabalhador.encerrar()
+        novo = Trabalhador()
+        self.trabalhadores[self.trabalhadores.index(trabalhador)] = novo
+        return novo
+
+    async def resolver(self, algoritmo, W, V, itens, timeout=None):
+        """
+        Resolve (ou acompanha uma resolução idêntica já em andamento).
+        Cada pedido espera no máximo o próprio timeout; a resolução compartilhada
+        dura até o prazo mais distante entre os pedidos que a acompanham.
+        Retorna (valor, solucao, tempo); levanta Sobrecarga ou TempoEsgotado.
+        """
+        timeout = min(timeout or self.timeout_padrao, self.timeout_max)
+        prazo = asyncio.get_running_loop().time() + timeout
+        chave = (algoritmo, W, V, tuple(itens))
+        andamento = self.em_andamento.get(chave)
+
+        if andamento is not None:
+            self.contadores['deduplicadas'] += 1
+            andamento['prazo'] = max(andamento['prazo'], prazo)
+        else:
+            if self.pendentes >= self.max_pendentes:
+                self.contadores['rejeitadas'] += 1
+                raise Sobrecarga()
+
+            self.pendentes += 1
+            andamento = {'prazo': prazo}
+            andamento['tarefa'] = asyncio.ensure_future(self._executar(algoritmo, W, V, itens, andamento))
+            self.em_andamento[chave] = andamento
+
+            def concluir(tarefa):
+                self.pendentes -= 1
+                self.em_andamento.pop(chave, None)
+                # Todos os pedidos podem ter desistido antes: marca a exceção como lida
+                if not tarefa.cancelled():
+                    tarefa.exception()
+            andamento['tarefa'].add_done_callback(concluir)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(andamento['tarefa']), timeout)
+        except (asyncio.TimeoutError, TempoEsgotado):
+            self.contadores['tempos_esgotados'] += 1
+            raise TempoEsgotado()
+
+    async def _aguardar(self, futuro, andamento):
+        """
+        Espera `futuro` até andamento['prazo'], que outros pedidos idênticos
+        podem estender enquanto isso. True se terminou, False se o prazo acabou.
+        asyncio.wait (e não wait_for) para não cancelar o futuro: um trabalhador
+        entregue pela fila no mesmo instante do prazo não se perde.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            restante = andamento['prazo'] - loop.time()
+            if restante <= 0:
+                return False
+            prontos, _ = await asyncio.wait({futuro}, timeout=restante)
+            if prontos:
+                return True
+
+    async def _executar(self, algoritmo, W, V, itens, andamento):
+        nome_func, _ = ALGORITMOS[algoritmo]
+
+        # O prazo vale para a resolução inteira, inclusive a espera por um trabalhador livre
+        obter = asyncio.ensure_future(self.ociosos.get())
+        try:
+            pronto = await self._aguardar(obter, andamento)
+        except asyncio.CancelledError:
+            obter.cancel()
+            raise
+        if not pronto:
+            obter.cancel()
+            raise TempoEsgotado()
+        trabalhador = obter.result()
+
+        try:
+            resposta = await trabalhador.executar((nome_func, W, V, itens),
+                                                  lambda futuro: self._aguardar(futuro, andamento))
+        except asyncio.TimeoutError:
+            # O processo continua calculando: mata e coloca um novo no lugar
+            trabalhador = self._substituir(trabalhador)
+            raise TempoEsgotado()
+        except asyncio.CancelledError:
+            trabalhador = self._substituir(trabalhador)
+            raise
+        finally:
+            self.ociosos.put_nowait(trabalhador)
+
+        if resposta[0] == 'erro':
+            raise RuntimeError(resposta[1])
+        self.contadores['atendidas'] += 1
+        return resposta[1:]
+
+    def status(self):
+        return dict(self.contadores,
+                    trabalhadores=self.n_trabalhadores,
+                    ociosos=self.ociosos.qsize(),
+                    pendentes=self.pendentes,
+                    max_pendentes=self.max_pendentes)
+
+    # ---- HTTP ------------------------------------------------------------
+
+    async def _tratar(self, metodo, alvo, cabecalhos, corpo):
+        url = urlsplit(alvo)
+        parametros = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if url.path == '/status' and metodo == 'GET':
+            return 200, self.status()
+        if url.path != '/solve' or metodo != 'POST':
+            return 404, {'erro': f'{metodo} {url.path} não existe'}
+
+        algoritmo = parametros.get('algoritmo', 'branch_and_bound')
+        if algoritmo not in ALGORITMOS:
+            return 400, {'erro': f"algoritmo desconhecido: {algoritmo}"}
+
+        try:
+            timeout = float(parametros['timeout']) if 'timeout' in parametros else None
+            if cabecalhos.get('content-type') == 'application/octet-stream':
+                instancia = decodificar_binario(corpo)
+            else:
+                instancia = interpretar_instancia(corpo.decode().splitlines())
+            if instancia is None:
+                raise ValueError("instância vazia")
+        except (ValueError, UnicodeDecodeError, struct.error) as e:
+            return 400, {'erro': f"instância inválida: {e}"}
+
+        W, V, itens = instancia
+        try:
+            valor, solucao, tempo = await self.resolver(algoritmo, W, V, itens, timeout)
+        except Sobrecarga:
+            return 503, {'erro': 'serviço sobrecarregado, tente novamente'}
+        except TempoEsgotado:
+            return 504, {'erro': 'tempo esgotado'}
+        except RuntimeError as e:
+            return 500, {'erro': str(e)}
+
+        return 200, {
+            'algoritmo': algoritmo,
+            'valor': valor,
+            'itens': [i for i in range(len(solucao)) if solucao[i]],
+            'tempo': tempo,
+        }
+
+    async def atender(self, leitor, escritor):
+        """Atende uma conexão HTTP/1.1 (com keep-alive)."""
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                metodo, alvo, _ = linha.decode('latin-1').split(' ', 2)
+
+                cabecalhos = {}
+                while True:
+                    linha = await leitor.readline()
+                    if linha in (b'\r\n', b'\n', b''):
+                        break
+                    nome, _, valor = linha.decode('latin-1').partition(':')
+                    cabecalhos[nome.strip().lower()] = valor.strip()
+
+                corpo = await leitor.readexactly(int(cabecalhos.get('content-length', 0)))
+                status, resposta = await self._tratar(metodo, alvo, cabecalhos, corpo)
+
+                dados = json.dumps(resposta).encode()
+                fechar = cabecalhos.get('connection', '').lower() == 'close'
+                cabecalho = (f"HTTP/1.1 {status} {MOTIVOS[status]}\r\n"
+                             f"Content-Type: application/json\r\n"
+                             f"Content-Length: {len(dados)}\r\n")
+                if fechar:
+                    cabecalho += "Connection: close\r\n"
+                escritor.write(cabecalho.encode() + b"\r\n" + dados)
+                await escritor.drain()
+                if fechar:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            escritor.close()
+
+async def servir(servico, porta=8765, caminho_unix=None, host='127.0.0.1'):
+    servico.iniciar()
+    try:
+        if caminho_unix:
+            servidor = await asyncio.start_unix_server(servico.atender, path=caminho_unix)
+            print(f"Servindo em unix:{caminho_unix} com {servico.n_trabalhadores} trabalhadores")
+        else:
+            servidor = await asyncio.start_server(servico.atender, host, porta)
+            print(f"Servindo em http://{host}:{porta} com {servico.n_trabalhadores} trabalhadores")
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        servico.encerrar()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serviço local de resolução da mochila.')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--unix', metavar='CAMINHO', help='escuta em um socket Unix em vez de TCP')
+    parser.add_argument('--trabalhadores', type=int, default=None, help='padrão: número de CPUs')
+    parser.add_argument('--max-pendentes', type=int, default=None,
+                        help='resoluções em fila/execução antes de responder 503 (padrão: 32 por trabalhador)')
+    parser.add_argument('--timeout', type=float, default=10.0, help='timeout padrão por pedido (s)')
+    parser.add_argument('--timeout-max', type=float, default=60.0, help='maior timeout aceito (s)')
+    args = parser.parse_args(argv)
+
+    servico = ServicoMochila(args.trabalhadores, args.max_pendentes, args.timeout, args.timeout_max)
+    try:
+        asyncio.run(servir(servico, args.porta, args.unix, args.host))
+    except KeyboardInterrupt:
+        print("\nServiço encerrado.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,39 @@
 import os
 
+# Caminhos absolutos a partir de src/, para que os scripts rodem de qualquer diretório
+DIRETORIO_SRC = os.path.dirname(os.path.abspath(__file__))
+DIRETORIO_INSTANCIAS = os.path.join(os.path.dirname(DIRETORIO_SRC), "instancias")
+DIRETORIO_RESULTADOS = os.path.join(DIRETORIO_SRC, "resultados")
+DIRETORIO_GRAFICOS = os.path.join(DIRETORIO_SRC, "graficos")
+
+def interpretar_instancia(linhas):
+    """
+    Interpreta as linhas de uma instância (arquivo aberto ou texto.splitlines()).
+    Retorna (W, V, itens) ou None se a primeira linha estiver vazia.
+    Levanta ValueError se alguma linha não tiver o número de campos esperado.
+    """
+    linhas = iter(linhas)
+    
+    # Lê a primeira linha e remove espaços/quebras de linha extras
+    linha_capacidades = next(linhas, '').strip()
+    if not linha_capacidades:
+        return None
+    
+    # Separa W e V por tabulação 
+    W, V = map(int, linha_capacidades.split('\t'))
+    
+    itens = []
+    for linha in linhas:
+        linha = linha.strip()
+        if linha:
+            # Cada item tem peso, volume e valor [cite: 7, 9]
+            dados = list(map(int, linha.split('\t')))
+            if len(dados) != 3:
+                raise ValueError(f"item com {len(dados)} campos, esperado 3 (peso, volume, valor): {linha!r}")
+            itens.append(tuple(dados))
+    
+    return W, V, itens
+
 def ler_instancia(caminho_arquivo):
     """
     Lê o arquivo de instância e retorna as capacidades e a lista de itens.
@@ -9,23 +43,7 @@ def ler_instancia(caminho_arquivo):
     """
     try:
         with open(caminho_arquivo, 'r') as f:
-            # Lê a primeira linha e remove espaços/quebras de linha extras
-            linha_capacidades = f.readline().strip()
-            if not linha_capacidades:
-                return None
-            
-            # Separa W e V por tabulação 
-            W, V = map(int, linha_capacidades.split('\t'))
-            
-            itens = []
-            for linha in f:
-                linha = linha.strip()
-                if linha:
-                    # Cada item tem peso, volume e valor [cite: 7, 9]
-                    dados = list(map(int, linha.split('\t')))
-                    itens.append(tuple(dados))
-            
-            return W, V, itens
+            return interpretar_instancia(f)
             
     except FileNotFoundError:
         print(f"Erro: Arquivo {caminho_arquivo} não encontrado.")
@@ -34,6 +52,27 @@ def ler_instancia(caminho_arquivo):
         print(f"Erro ao ler arquivo: {e}")
         return None
 
+class TempoLimiteExcedido(Exception):
+    """Execução interrompida por executar_com_limite."""
+
+def executar_com_limite(func, limite, *args):
+    """
+    Chama func(*args) interrompendo com TempoLimiteExcedido depois de `limite`
+    segundos (usa SIGALRM, então só funciona na thread principal em Unix).
+    """
+    import signal
+
+    def estourou(*_):
+        raise TempoLimiteExcedido()
+
+    tratador_anterior = signal.signal(signal.SIGALRM, estourou)
+    signal.setitimer(signal.ITIMER_REAL, limite)
+    try:
+        return func(*args)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, tratador_anterior)
+
 def salvar_resultado(caminho_arquivo, lucro, itens_selecionados, tempo_execucao):
     """
     Opcional: Salva a saída conforme exigido pelo trabalho.
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Verificação diferencial de corretude e de desempenho de todos os algoritmos.
+
+Roda cada motor (os algoritmos de knapsack.ALGORITMOS, incluindo `auto`, e as
+sessões incrementais de algoritmos/incremental.py) sobre instâncias geradas e
+sobre as guardadas em instancias/, e confere para cada resposta:
+
+- a solução tem um booleano por item e respeita W e V;
+- a soma dos valores dos itens escolhidos é o valor informado;
+- o valor é o mesmo de todos os outros motores e, para n <= N_FORCA_BRUTA,
+  o mesmo da força bruta;
+- as buscas instrumentadas (`backtrack_instrumentado`, cópias de `backtrack`)
+  dão exatamente o mesmo valor e a mesma solução das originais.
+
+Execuções que passam de `--limite` segundos são puladas (não contam como erro),
+exceto as de `auto`: a seleção automática existe justamente para não escolher
+um algoritmo que não termina. Por isso, além das instâncias pequenas, entram
+algumas instâncias grandes guardadas (GRANDES, n = 50), onde as buscas em
+árvore estouram o limite e só a PD termina.
+Os tempos (mínimo de `--repeticoes`) podem ser salvos como baseline e, com
+--verificar-tempo, a soma dos tempos de cada motor é comparada com ela.
+O código de saída é 1 se houver resposta errada ou regressão de desempenho.
+
+Uso:
+    python3 verificacao.py
+    python3 verificacao.py --salvar-baseline
+    python3 verificacao.py --verificar-tempo --limiar 1.5
+"""
+
+import argparse
+import importlib.util
+import itertools
+import json
+import os
+import random
+import sys
+from functools import partial
+from gerador_instancias import gerar_itens
+from utils import (ler_instancia, executar_com_limite, TempoLimiteExcedido,
+                   DIRETORIO_INSTANCIAS, DIRETORIO_RESULTADOS)
+
+CAMINHO_BASELINE = os.path.join(DIRETORIO_RESULTADOS, "verificacao_baseline.json")
+
+# Até este n a resposta também é comparada com a força bruta
+N_FORCA_BRUTA = 12
+
+# Instâncias de instancias/ em que as buscas em árvore não terminam
+GRANDES = ['W100_V100/instancia_n50.txt', 'W80_V80/instancia_n50.txt']
+
+# Motores que não podem passar do limite de tempo
+OBRIGATORIOS = {'auto'}
+
+# Motor instrumentado -> motor original que ele precisa reproduzir exatamente
+INSTRUMENTADOS = {
+    'backtracking_instrumentado': 'backtracking',
+    'branch_and_bound_instrumentado': 'branch_and_bound',
+}
+
+def _resolver_sessao(motor, W, V, itens):
+    """
+    Resolve passando pelos caminhos incrementais da SessaoMochila: começa sem
+    o último item, adiciona-o, altera o primeiro item e desfaz a alteração.
+    """
+    from algoritmos.incremental import SessaoMochila
+
+    if not itens:
+        return SessaoMochila(W, V, itens, motor).resolver()
+
+    sessao = SessaoMochila(W, V, itens[:-1], motor)
+    sessao.resolver()
+    sessao.adicionar_item(itens[-1])
+    peso, volume, valor = itens[0]
+    sessao.alterar_item(0, (peso, volume, valor + 1))
+    sessao.resolver()
+    sessao.alterar_item(0, itens[0])
+    return sessao.resolver()
+
+def _resolver_instrumentado(nome_func, W, V, itens):
+    import experimentos
+    from algoritmos.instrumentacao import Instrumentacao
+
+    return getattr(experimentos, nome_func)(W, V, itens, Instrumentacao(len(itens)))
+
+def carregar_motores():
+    """{nome: resolver(W, V, itens) -> (valor, solucao, tempo)}"""
+    import experimentos
+    from knapsack import ALGORITMOS
+
+    motores = {}
+    for nome, (nome_func, _) in ALGORITMOS.items():
+        if nome == 'dinamico_memmap' and importlib.util.find_spec('numpy') is None:
+            print("⚠️  numpy não instalado: dinamico_memmap fica de fora")
+            continue
+        motores[nome] = getattr(experimentos, nome_func)
+
+    for instrumentado, original in INSTRUMENTADOS.items():
+        motores[instrumentado] = partial(_resolver_instrumentado, ALGORITMOS[original][0])
+    motores['sessao_dinamico'] = partial(_resolver_sessao, 'dinamico')
+    motores['sessao_branch_and_bound'] = partial(_resolver_sessao, 'branch_and_bound')
+    return motores
+
+def gerar_instancias(quantidade=30, sementes_iniciais=0):
+    """Instâncias pequenas e variadas (inclusive n = 0 e mochilas apertadas)."""
+    instancias = {}
+    for semente in range(sementes_iniciais, sementes_iniciais + quantidade):
+        rng = random.Random(semente)
+        n = rng.randint(0, 16)
+        W, V = rng.randint(0, 60), rng.randint(0, 60)
+        instancias[f"gerada_s{semente}_n{n}_W{W}_V{V}"] = (W, V, gerar_itens(n, rng))
+    return instancias
+
+def carregar_armazenadas(max_n=20, pasta_instancias=DIRETORIO_INSTANCIAS, grandes=()):
+    """Instâncias de instancias/ com até max_n itens, mais as de `grandes` (PASTA/arquivo)."""
+    instancias = {}
+    for id_instancia in grandes:
+        instancia = ler_instancia(os.path.join(pasta_instancias, id_instancia))
+        if instancia:
+            instancias[id_instancia] = instancia
+    for pasta in sorted(os.listdir(pasta_instancias)):
+        caminho_pasta = os.path.join(pasta_instancias, pasta)
+        if not os.path.isdir(caminho_pasta):
+            continue
+        for arquivo in sorted(os.listdir(caminho_pasta)):
+            if not arquivo.endswith('.txt'):
+                continue
+            instancia = ler_instancia(os.path.join(caminho_pasta, arquivo))
+            if instancia and len(instancia[2]) <= max_n:
+                instancias[f"{pasta}/{arquivo}"] = instancia
+    return instancias
+
+def forca_bruta(W, V, itens):
+    melhor = 0
+    for escolha in itertools.product((False, True), repeat=len(itens)):
+        peso = volume = valor = 0
+        for (p, l, v), usado in zip(itens, escolha):
+            if usado:
+                peso, volume, valor = peso + p, volume + l, valor + v
+        if peso <= W and volume <= V and valor > melhor:
+            melhor = valor
+    return melhor
+
+def conferir_solucao(W, V, itens, valor, solucao):
+    """Lista de problemas da resposta (vazia se ela é consistente e viável)."""
+    if len(solucao) != len(itens):
+        return [f"solução com {len(solucao)} posições para {len(itens)} itens"]
+
+    problemas = []
+    peso = sum(item[0] for item, usado in zip(itens, solucao) if usado)
+    volume = sum(item[1] for item, usado in zip(itens, solucao) if usado)
+    soma = sum(item[2] for item, usado in zip(itens, solucao) if usado)
+    if peso > W:
+        problemas.append(f"peso {peso} > W={W}")
+    if volume > V:
+        problemas.append(f"volume {volume} > V={V}")
+    if soma != valor:
+        problemas.append(f"itens somam {soma}, valor informado {valor}")
+    return problemas
+
+def verificar(motores, instancias, limite=2.0, repeticoes=3):
+    """
+    Roda todos os motores em todas as instâncias.
+    Retorna (erros, tempos) com tempos = {motor: {instancia: segundos}}.
+    """
+    erros = []
+    tempos = {nome: {} for nome in motores}
+
+    for id_instancia, (W, V, itens) in instancias.items():
+        valores = {}
+        solucoes = {}
+        for nome, resolver in motores.items():
+            try:
+                melhor_tempo = None
+                for _ in range(repeticoes):
+                    valor, solucao, tempo = executar_com_limite(resolver, limite, W, V, list(itens))
+                    melhor_tempo = tempo if melhor_tempo is None else min(melhor_tempo, tempo)
+            except TempoLimiteExcedido:
+                if nome in OBRIGATORIOS:
+                    erros.append(f"{id_instancia} [{nome}]: passou do limite de {limite}s")
+                continue
+            except Exception as e:
+                erros.append(f"{id_instancia} [{nome}]: exceção {e!r}")
+                continue
+
+            tempos[nome][id_instancia] = melhor_tempo
+            valores[nome] = valor
+            solucoes[nome] = list(solucao)
+            for problema in conferir_solucao(W, V, itens, valor, solucao):
+                erros.append(f"{id_instancia} [{nome}]: {problema}")
+
+        if len(itens) <= N_FORCA_BRUTA:
+            valores['forca_bruta'] = forca_bruta(W, V, itens)
+
+        if len(set(valores.values())) > 1:
+            detalhes = ', '.join(f"{nome}={valor}" for nome, valor in sorted(valores.items()))
+            erros.append(f"{id_instancia}: valores diferentes ({detalhes})")
+
+        for instrumentado, original in INSTRUMENTADOS.items():
+            if instrumentado in solucoes and original in solucoes and (
+                    (valores[instrumentado], solucoes[instrumentado]) !=
+                    (valores[original], solucoes[original])):
+                erros.append(f"{id_instancia} [{instrumentado}]: resposta diferente de {original}")
+
+    return erros, tempos
+
+def comparar_tempos(tempos, baseline, limiar=1.5, tempo_minimo=1e-3):
+    """
+    Regressões de desempenho: para cada motor, soma dos tempos nas instâncias
+    em comum com a baseline (ignorando as abaixo de `tempo_minimo` na baseline)
+    dividida pela soma da baseline, acima de `limiar`.
+    """
+    problemas = []
+    for nome, tempos_motor in tempos.items():
+        base = {i: t for i, t in baseline.get(nome, {}).items() if t >= tempo_minimo}
+        comuns = [i for i in base if i in tempos_motor]
+        if not comuns:
+            continue
+        razao = sum(tempos_motor[i] for i in comuns) / sum(base[i] for i in comuns)
+        print(f"   {nome}: {razao:.2f}x a baseline ({len(comuns)} instâncias)")
+        if razao > limiar:
+            problemas.append(f"{nome}: {razao:.2f}x mais lento que a baseline")
+    return problemas
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Verificação diferencial dos algoritmos.')
+    parser.add_argument('--geradas', type=int, default=30, help='quantidade de instâncias geradas')
+    parser.add_argument('--max-n', type=int, default=20,
+                        help='maior n das instâncias de instancias/ a incluir (0 = nenhuma)')
+    parser.add_argument('--grandes', nargs='*', default=GRANDES, metavar='PASTA/ARQUIVO',
+                        help='instâncias grandes de instancias/ incluídas além de --max-n')
+    parser.add_argument('--limite', type=float, default=2.0,
+                        help='tempo máximo (s) por execução; acima disso a execução é pulada')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--baseline', default=CAMINHO_BASELINE)
+    parser.add_argument('--salvar-baseline', action='store_true')
+    parser.add_argument('--verificar-tempo', action='store_true',
+                        help='compara os tempos com a baseline e falha acima do limiar')
+    parser.add_argument('--limiar', type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    motores = carregar_motores()
+    instancias = gerar_instancias(args.geradas)
+    instancias.update(carregar_armazenadas(args.max_n, grandes=args.grandes))
+    print(f"Verificando {len(motores)} motores em {len(instancias)} instâncias...")
+
+    erros, tempos = verificar(motores, instancias, args.limite, args.repeticoes)
+
+    print("\n" + "="*80)
+    print("CORRETUDE")
+    print("="*80)
+    for nome, tempos_motor in tempos.items():
+        pulados = len(instancias) - len(tempos_motor)
+        texto_pulados = f", {pulados} puladas por tempo" if pulados else ""
+        print(f"   {nome}: {len(tempos_motor)} instâncias{texto_pulados}")
+    if erros:
+        print(f"\n❌ {len(erros)} PROBLEMAS:")
+        for erro in erros:
+            print(f"   {erro}")
+    else:
+        print("\n✅ Todos os motores deram soluções viáveis, consistentes e ótimas.")
+
+    regressoes = []
+    if args.verificar_tempo:
+        print("\n" + "="*80)
+        print("DESEMPENHO")
+        print("="*80)
+        if not os.path.isfile(args.baseline):
+            print(f"❌ Baseline {args.baseline} não encontrada. Rode antes com --salvar-baseline.")
+            return 1
+        with open(args.baseline) as f:
+            regressoes = comparar_tempos(tempos, json.load(f), args.limiar)
+        if regressoes:
+            print("\n❌ REGRESSÕES DE DESEMPENHO:")
+            for regressao in regressoes:
+                print(f"   {regressao}")
+        else:
+            print("\n✅ Nenhuma regressão em relação à baseline.")
+
+    if args.salvar_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(tempos, f, indent=2)
+        print(f"\n✔ Baseline salva em {args.baseline}")
+
+    return 1 if erros or regressoes else 0
+
+if __name__ == "__main__":
+    sys.exit(main())